@@ -5,9 +5,16 @@ from .core import NovaEngine
 from .time import Time
 from .utils import Colors, Utils
 from .dev_tools import DevTools, log, get_globals
-from .sprite import Sprite, Group
+from .sprite import Sprite, Group, RotationCache
+from .animation import AnimationClip, AnimationState
 from .sprite_like import *
 from .gui import *
 from .scenes import Scene
+from .tilemap import Tilemap
+from .camera import Camera
+from .particles import ParticlePool
 from .sound import SoundManager
-from .saves import SaveManager
\ No newline at end of file
+from .assets import AssetManager
+from .profiler import Profiler
+from .saves import SaveManager
+from . import net
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""===== animation.py =====
+Module for sprite animations.
+
+Provides AnimationClip, an immutable animation shared between sprites,
+and AnimationState, the small per-sprite playback state.
+"""
+
+
+class AnimationClip:
+    """
+    Immutable animation: frames, time per frame and looping.
+
+    One clip is meant to be shared by every sprite playing it.
+    """
+
+    __slots__ = ("name", "frames", "speed", "loop")
+
+    def __init__(self, name: str, frames, speed: float = 0.1, loop: bool = True):
+        """
+        Args:
+            name (str): Animation name.
+            frames (Iterable[pygame.Surface]): Frame surfaces.
+            speed (float): Time per frame in seconds.
+            loop (bool): Whether animation loops.
+        """
+        frames = tuple(frames)
+        if not frames:
+            raise ValueError(f"Animation '{name}' has no frames")
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "frames", frames)
+        object.__setattr__(self, "speed", speed)
+        object.__setattr__(self, "loop", loop)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("AnimationClip is immutable")
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __repr__(self):
+        return f"AnimationClip({self.name!r}, {len(self.frames)} frames, speed={self.speed}, loop={self.loop})"
+
+
+class AnimationState:
+    """Playback state of one sprite: current clip, its name, frame index and timer."""
+
+    __slots__ = ("clip", "name", "index", "timer")
+
+    def __init__(self):
+        self.clip: AnimationClip | None = None
+        self.name: str | None = None  # name the clip was registered under
+        self.index = 0
+        self.timer = 0.0
+
+    def play(self, clip: AnimationClip, name: str | None = None):
+        """
+        Start clip from its first frame.
+
+        Args:
+            clip (AnimationClip): Clip to play.
+            name (str | None): Name the clip is registered under (default: clip name).
+
+        Returns:
+            pygame.Surface: First frame.
+        """
+        self.clip = clip
+        self.name = name if name is not None else clip.name
+        self.index = 0
+        self.timer = 0.0
+        return clip.frames[0]
+
+    def advance(self, dt: float):
+        """
+        Advance playback by `dt` seconds.
+
+        Returns:
+            pygame.Surface | None: New frame if it changed, else None.
+        """
+        clip = self.clip
+        if clip is None:
+            return None
+
+        self.timer += dt
+        if self.timer < clip.speed:
+            return None
+
+        self.timer = 0.0
+        index = self.index + 1
+        if index >= len(clip.frames):
+            index = 0 if clip.loop else len(clip.frames) - 1
+        if index == self.index:
+            return None
+        self.index = index
+        return clip.frames[index]
+
+    @property
+    def finished(self) -> bool:
+        """True when a non-looping clip reached its last frame."""
+        clip = self.clip
+        return clip is not None and not clip.loop and self.index == len(clip.frames) - 1
@@ -0,0 +1,183 @@
+"""===== assets.py ====="""
+
+import pygame
+from collections import OrderedDict
+
+
+class AssetManager:
+    """
+    Shared cache of loaded images.
+
+    Images are keyed on (path, size), so every sprite created from the
+    same file and size gets the same surface instead of decoding the file
+    again. Least recently used images are evicted when the memory budget
+    is exceeded.
+
+    Cached surfaces are shared: don't draw on them directly, copy first.
+    """
+
+    images = OrderedDict()  # (path, size) -> pygame.Surface
+    sheets = {}  # (path, frame size, size, count, margin, spacing) -> tuple of frames, not in memory_budget
+    memory_budget = 256 * 1024 * 1024  # bytes
+    memory_used = 0
+
+    hits = 0
+    misses = 0
+    evictions = 0
+
+    @staticmethod
+    def load_image(path, width=None, height=None):
+        """
+        Load image (once) and optionally scale it.
+
+        Args:
+            path (str): Path to image file.
+            width (int | None): Width to scale.
+            height (int | None): Height to scale.
+
+        Returns:
+            pygame.Surface: Shared cached surface.
+        """
+        size = (int(width), int(height)) if width and height else None
+        key = (path, size)
+
+        img = AssetManager.images.get(key)
+        if img is not None:
+            AssetManager.hits += 1
+            AssetManager.images.move_to_end(key)
+            return img
+
+        AssetManager.misses += 1
+        if size is None:
+            img = pygame.image.load(path).convert_alpha()
+        else:
+            img = pygame.transform.scale(AssetManager.load_image(path), size)
+
+        AssetManager._store(key, img)
+        return img
+
+    @staticmethod
+    def load_sheet(path, frame_width, frame_height, count=None, size=None, margin=0, spacing=0):
+        """
+        Slice a sprite sheet into animation frames (once per sheet).
+
+        Frames are subsurfaces of one shared sheet image, so no pixels are copied.
+        Frames are read left to right, top to bottom.
+
+        Sliced sheets stay cached until `clear()`: they are not limited by
+        `memory_budget` and don't count in `hits`/`misses` (a scaled sheet
+        is only kept alive by its frames).
+
+        Args:
+            path (str): Path to sheet image.
+            frame_width (int): Frame width in the sheet.
+            frame_height (int): Frame height in the sheet.
+            count (int | None): Number of frames (default: all that fit).
+            size (tuple[int, int] | None): Scale frames to this size (the sheet is scaled once).
+            margin (int): Pixels around the frame grid.
+            spacing (int): Pixels between frames.
+
+        Returns:
+            tuple[pygame.Surface, ...]: Shared frames.
+        """
+        key = (path, frame_width, frame_height, count, size, margin, spacing)
+        frames = AssetManager.sheets.get(key)
+        if frames is not None:
+            return frames
+
+        sheet = AssetManager.load_image(path)
+        fw, fh = frame_width, frame_height
+        cols = (sheet.get_width() - 2 * margin + spacing) // (fw + spacing)
+        rows = (sheet.get_height() - 2 * margin + spacing) // (fh + spacing)
+
+        margin_x = margin_y = margin
+        spacing_x = spacing_y = spacing
+        if size is not None and size != (fw, fh):
+            # scale whole sheet once, keeping the grid layout
+            sx, sy = size[0] / fw, size[1] / fh
+            fw, fh = size
+            margin_x, margin_y = round(margin * sx), round(margin * sy)
+            spacing_x, spacing_y = round(spacing * sx), round(spacing * sy)
+            width = max(round(sheet.get_width() * sx), 2 * margin_x + cols * (fw + spacing_x) - spacing_x)
+            height = max(round(sheet.get_height() * sy), 2 * margin_y + rows * (fh + spacing_y) - spacing_y)
+            sheet = pygame.transform.scale(sheet, (width, height))
+
+        frames = []
+        for row in range(rows):
+            for col in range(cols):
+                if count is not None and len(frames) >= count:
+                    break
+                x = margin_x + col * (fw + spacing_x)
+                y = margin_y + row * (fh + spacing_y)
+                frames.append(sheet.subsurface((x, y, fw, fh)))
+
+        frames = tuple(frames)
+        AssetManager.sheets[key] = frames
+        return frames
+
+    @staticmethod
+    def preload(*assets):
+        """
+        Load images into cache ahead of time (e.g. on a loading screen).
+
+        Args:
+            *assets (str | tuple): Paths or (path, width, height) tuples.
+
+        Returns:
+            int: Number of loaded images.
+        """
+        loaded = 0
+        for asset in assets:
+            if isinstance(asset, (tuple, list)):
+                AssetManager.load_image(*asset)
+            else:
+                AssetManager.load_image(asset)
+            loaded += 1
+        return loaded
+
+    @staticmethod
+    def set_memory_budget(budget):
+        """Set max cache size in bytes and evict images above it."""
+        AssetManager.memory_budget = budget
+        AssetManager._evict()
+
+    @staticmethod
+    def stats():
+        """Return cache statistics."""
+        total = AssetManager.hits + AssetManager.misses
+        return {
+            "images": len(AssetManager.images),
+            "memory_used": AssetManager.memory_used,
+            "memory_budget": AssetManager.memory_budget,
+            "hits": AssetManager.hits,
+            "misses": AssetManager.misses,
+            "evictions": AssetManager.evictions,
+            "hit_rate": AssetManager.hits / total if total else 0.0,
+        }
+
+    @staticmethod
+    def clear():
+        """Drop all cached images and reset statistics."""
+        AssetManager.images.clear()
+        AssetManager.sheets.clear()
+        AssetManager.memory_used = 0
+        AssetManager.hits = AssetManager.misses = AssetManager.evictions = 0
+
+    @staticmethod
+    def _store(key, img):
+        AssetManager.images[key] = img
+        AssetManager.memory_used += AssetManager._size_of(img)
+        AssetManager._evict()
+
+    @staticmethod
+    def _evict():
+        images = AssetManager.images
+        # always keep the most recent image
+        while AssetManager.memory_used > AssetManager.memory_budget and len(images) > 1:
+            _, img = images.popitem(last=False)
+            AssetManager.memory_used -= AssetManager._size_of(img)
+            AssetManager.evictions += 1
+
+    @staticmethod
+    def _size_of(img):
+        return img.get_pitch() * img.get_height()
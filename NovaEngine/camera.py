@@ -0,0 +1,169 @@
+"""===== camera.py =====
+Module for scene cameras.
+
+Provides the Camera class: a world-to-screen transform with zoom and an
+optional follow target. Objects outside the camera viewport are culled
+before drawing, so big worlds only pay for what is visible.
+"""
+
+import weakref
+import pygame
+
+
+class Camera:
+    """
+    Viewport into the scene world.
+
+    Supports:
+        * world <-> screen conversion
+        * following a sprite (optionally smoothed)
+        * zoom (scaled images are cached)
+        * clamping to world bounds
+    """
+
+    def __init__(self, width: int | None = None, height: int | None = None, zoom: float = 1.0):
+        """
+        Initialize a new camera.
+
+        Args:
+            width (int | None): Viewport width on screen (default: screen width).
+            height (int | None): Viewport height on screen (default: screen height).
+            zoom (float): Zoom factor, 2 means everything is twice as big.
+        """
+        from .core import NovaEngine
+
+        self.engine = NovaEngine.Engine
+        screen_w, screen_h = self.engine.screen.get_size()
+        self.width = width or screen_w
+        self.height = height or screen_h
+        self.zoom = zoom
+
+        self.x, self.y = 0.0, 0.0  # world position of viewport top-left
+        self.target = None
+        self.smoothing = 1.0
+        self.bounds: pygame.Rect | None = None
+
+        self.viewport = pygame.Rect(0, 0, self.width, self.height)  # visible world rect
+        self._scaled = weakref.WeakKeyDictionary()  # image -> (zoom, scaled image)
+        self._update_viewport()
+
+    # ========================
+    # CONTROL
+    # ========================
+    def follow(self, target, smoothing: float = 1.0):
+        """
+        Keep target in the center of the viewport.
+
+        Args:
+            target (Sprite | None): Sprite to follow, None to stop.
+            smoothing (float): Part of the distance covered each frame (1 is instant).
+
+        Returns:
+            Camera: Returns self for chaining.
+        """
+        self.target = target
+        self.smoothing = smoothing
+        return self
+
+    def set_bounds(self, rect):
+        """
+        Keep viewport inside a world rect (None to disable).
+
+        Returns:
+            Camera: Returns self for chaining.
+        """
+        self.bounds = pygame.Rect(rect) if rect is not None else None
+        return self
+
+    def set_zoom(self, zoom: float):
+        """
+        Set zoom factor.
+
+        Returns:
+            Camera: Returns self for chaining.
+        """
+        self.zoom = max(zoom, 0.01)
+        self._update_viewport()
+        return self
+
+    def look_at(self, x: float, y: float):
+        """
+        Center viewport on a world point.
+
+        Returns:
+            Camera: Returns self for chaining.
+        """
+        self.x = x - self.width / self.zoom / 2
+        self.y = y - self.height / self.zoom / 2
+        self._update_viewport()
+        return self
+
+    def update(self):
+        """Move towards the follow target. Called by the scene once per frame."""
+        if self.target is not None:
+            tx, ty = self.target.rect.center
+            tx -= self.width / self.zoom / 2
+            ty -= self.height / self.zoom / 2
+            self.x += (tx - self.x) * self.smoothing
+            self.y += (ty - self.y) * self.smoothing
+        self._update_viewport()
+
+    def _update_viewport(self):
+        w, h = self.width / self.zoom, self.height / self.zoom
+        if self.bounds is not None:
+            b = self.bounds
+            self.x = max(b.left, min(self.x, b.right - w))
+            self.y = max(b.top, min(self.y, b.bottom - h))
+        self.viewport = pygame.Rect(int(self.x), int(self.y), int(w) + 1, int(h) + 1)
+
+    # ========================
+    # TRANSFORMS
+    # ========================
+    def to_screen(self, x: float, y: float) -> tuple[float, float]:
+        """Convert world point to screen point."""
+        return (x - self.x) * self.zoom, (y - self.y) * self.zoom
+
+    def to_world(self, x: float, y: float) -> tuple[float, float]:
+        """Convert screen point to world point."""
+        return x / self.zoom + self.x, y / self.zoom + self.y
+
+    def rect_to_screen(self, rect) -> pygame.Rect:
+        """Convert world rect to screen rect."""
+        rect = pygame.Rect(rect)
+        x, y = self.to_screen(rect.x, rect.y)
+        return pygame.Rect(x, y, rect.w * self.zoom, rect.h * self.zoom)
+
+    def mouse_pos(self) -> tuple[float, float]:
+        """Mouse position in world coordinates."""
+        return self.to_world(*pygame.mouse.get_pos())
+
+    def visible(self, rect) -> bool:
+        """Check if a world rect is inside the viewport."""
+        return self.viewport.colliderect(rect)
+
+    def scale_image(self, img: pygame.Surface) -> pygame.Surface:
+        """
+        Get image scaled by zoom (cached per image).
+
+        Returns:
+            pygame.Surface: Scaled image (or `img` itself at zoom 1).
+        """
+        zoom = self.zoom
+        if zoom == 1:
+            return img
+        cached = self._scaled.get(img)
+        if cached is not None and cached[0] == zoom:
+            return cached[1]
+        w, h = img.get_size()
+        scaled = pygame.transform.scale(img, (max(round(w * zoom), 1), max(round(h * zoom), 1)))
+        self._scaled[img] = (zoom, scaled)
+        return scaled
+
+    def apply(self, img: pygame.Surface, pos) -> tuple[pygame.Surface, tuple[float, float]]:
+        """
+        Transform image and its world blit position to screen.
+
+        Returns:
+            tuple[pygame.Surface, tuple[float, float]]: Image and screen position.
+        """
+        return self.scale_image(img), self.to_screen(*pos)
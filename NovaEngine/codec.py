@@ -0,0 +1,169 @@
+"""===== codec.py =====
+Compact tagged binary encoding of plain values.
+
+Used by network messages and save files. Supports None, bool, int
+(any size), float, str, bytes, list/tuple (decoded as list) and dict.
+Every value is one tag byte followed by big-endian data.
+
+Small ints and containers use the short forms; ints outside 64 bits and
+containers with more than 65535 items get their own wide tags.
+"""
+
+import struct
+
+_INT = struct.Struct("!q")
+_FLOAT = struct.Struct("!d")
+_LEN = struct.Struct("!I")
+_COUNT = struct.Struct("!H")
+_WIDE_COUNT = struct.Struct("!I")
+
+_INT_MIN, _INT_MAX = -(1 << 63), (1 << 63) - 1
+
+
+class DecodeError(ValueError):
+    """Malformed encoded data."""
+
+
+class EncodeError(ValueError):
+    """Value can't be encoded."""
+
+
+def pack_value(out: bytearray, value):
+    """Append tagged value to `out`."""
+    if value is None:
+        out += b"N"
+    elif value is True:
+        out += b"T"
+    elif value is False:
+        out += b"F"
+    elif isinstance(value, int):
+        if _INT_MIN <= value <= _INT_MAX:
+            out += b"i"
+            out += _INT.pack(value)
+        else:
+            data = value.to_bytes((value.bit_length() + 8) // 8, "big", signed=True)
+            out += b"I"
+            out += _LEN.pack(len(data))
+            out += data
+    elif isinstance(value, float):
+        out += b"f"
+        out += _FLOAT.pack(value)
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+        out += b"s"
+        out += _LEN.pack(len(data))
+        out += data
+    elif isinstance(value, (bytes, bytearray)):
+        out += b"b"
+        out += _LEN.pack(len(value))
+        out += value
+    elif isinstance(value, (list, tuple)):
+        _pack_count(out, b"l", b"L", len(value))
+        for item in value:
+            pack_value(out, item)
+    elif isinstance(value, dict):
+        _pack_count(out, b"d", b"D", len(value))
+        for key, item in value.items():
+            pack_value(out, key)
+            pack_value(out, item)
+    else:
+        raise TypeError(f"can't encode value of type {type(value).__name__}")
+
+
+def _pack_count(out: bytearray, tag: bytes, wide_tag: bytes, count: int):
+    """Append container tag and item count (wide form above 65535 items)."""
+    if count <= 0xFFFF:
+        out += tag
+        out += _COUNT.pack(count)
+    else:
+        out += wide_tag
+        out += _WIDE_COUNT.pack(count)
+
+
+def unpack_value(data, offset: int = 0):
+    """
+    Read tagged value from `data` at `offset`.
+
+    Returns:
+        tuple[object, int]: Value and offset after it.
+    """
+    try:
+        tag = data[offset]
+        offset += 1
+        if tag == 78:  # N
+            return None, offset
+        if tag == 84:  # T
+            return True, offset
+        if tag == 70:  # F
+            return False, offset
+        if tag == 105:  # i
+            return _INT.unpack_from(data, offset)[0], offset + _INT.size
+        if tag == 73:  # I
+            (size,) = _LEN.unpack_from(data, offset)
+            offset += _LEN.size
+            raw = bytes(data[offset:offset + size])
+            if len(raw) != size:
+                raise DecodeError("truncated value")
+            return int.from_bytes(raw, "big", signed=True), offset + size
+        if tag == 102:  # f
+            return _FLOAT.unpack_from(data, offset)[0], offset + _FLOAT.size
+        if tag in (115, 98):  # s, b
+            (size,) = _LEN.unpack_from(data, offset)
+            offset += _LEN.size
+            raw = bytes(data[offset:offset + size])
+            if len(raw) != size:
+                raise DecodeError("truncated value")
+            return (raw.decode("utf-8") if tag == 115 else raw), offset + size
+        if tag in (108, 76):  # l, L
+            count_struct = _COUNT if tag == 108 else _WIDE_COUNT
+            (count,) = count_struct.unpack_from(data, offset)
+            offset += count_struct.size
+            items = []
+            for _ in range(count):
+                item, offset = unpack_value(data, offset)
+                items.append(item)
+            return items, offset
+        if tag in (100, 68):  # d, D
+            count_struct = _COUNT if tag == 100 else _WIDE_COUNT
+            (count,) = count_struct.unpack_from(data, offset)
+            offset += count_struct.size
+            result = {}
+            for _ in range(count):
+                key, offset = unpack_value(data, offset)
+                result[key], offset = unpack_value(data, offset)
+            return result, offset
+    except (IndexError, struct.error, UnicodeDecodeError, TypeError) as e:
+        raise DecodeError(f"malformed value: {e}") from None
+    except RecursionError:
+        raise DecodeError("value is nested too deeply") from None
+    raise DecodeError(f"unknown value tag {tag}")
+
+
+def dumps(value) -> bytes:
+    """
+    Encode value to bytes.
+
+    Raises:
+        EncodeError: Value has an unsupported type, is too big or nested too deeply.
+    """
+    out = bytearray()
+    try:
+        pack_value(out, value)
+    except (TypeError, struct.error) as e:
+        raise EncodeError(str(e)) from None
+    except RecursionError:
+        raise EncodeError("value is nested too deeply") from None
+    return bytes(out)
+
+
+def loads(data):
+    """
+    Decode bytes produced by `dumps`.
+
+    Raises:
+        DecodeError: Data is malformed or has trailing bytes.
+    """
+    value, offset = unpack_value(data, 0)
+    if offset != len(data):
+        raise DecodeError("trailing data")
+    return value
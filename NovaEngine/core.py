@@ -1,8 +1,13 @@
 """===== engine.py ====="""
 
+import os
 import pygame
 import threading
+import weakref
+from collections import OrderedDict
 from .dev_tools import log, get_globals
+from .profiler import Profiler
+from .scheduler import Scheduler
 
 # ========================
 # ENGINE CONSTANTS
@@ -26,11 +31,19 @@ class NovaEngine:
     # ========================
     # INITIALIZATION
     # ========================
-    def __init__(self, window_size=(500, 500), app_name="Game", icon_path=None, fps=60):
+    def __init__(self, window_size=(500, 500), app_name="Game", icon_path=None, fps=60, headless=False):
         """
         Initialize the engine window and core systems.
+
+        With `headless=True` no real window or audio device is opened
+        (SDL dummy drivers), for servers, CI and benchmarks. Use `step()` to advance.
         """
 
+        self.headless = headless
+        if self.headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+
         pygame.init()
 
         self.app_name = app_name
@@ -53,6 +66,15 @@ class NovaEngine:
         self.debug = False
         self.dt: int = 0
 
+        # Fixed-timestep simulation
+        self.fixed_timestep = False
+        self.tick_rate = 120
+        self.fixed_dt = 1 / self.tick_rate
+        self.max_steps = 5  # max simulation steps per frame
+        self.alpha = 0.0  # render interpolation factor between two steps
+        self._accumulator = 0.0
+        self.fixed_run_func = None
+
         self.event_handlers = []
 
         # Input states
@@ -61,10 +83,27 @@ class NovaEngine:
         self.keys_pressed = []
         self.key_single_state = {}
 
+        # Frame profiler (disabled by default)
+        self.profiler = Profiler()
+
+        # Dirty-rect rendering
+        self.dirty_rendering = False
+        self.background = None  # cached background surface
+        self._bg_key = None
+        self._drawn = []  # (rect, key) drawn this frame
+        self._drawn_prev = []  # (rect, key) drawn previous frame
+        self._drawn_scene = None
+        self._full_redraw = True
+
         # Internal caches
-        self._text_cache = {}
-        self.cooldowns = []
-        self.intervals = []
+        self.text_cache_size = 512  # max rendered text surfaces kept
+        self._text_cache = OrderedDict()  # (text, font, size, color) -> Surface, LRU
+        self._glyph_cache = {}  # (char, font, size, color) -> Surface
+        self._fonts = {}  # (font, size) -> pygame.font.Font
+        self.cooldowns = weakref.WeakSet()  # live Time.Cooldown objects
+        self.cooldowns_paused = False
+        self.scheduler = Scheduler()  # timers and intervals (see Time)
+        self.net_clients = []  # connected net.NetClient objects, polled every frame
 
         # Scene system
         self.scenes = []
@@ -78,11 +117,15 @@ class NovaEngine:
             Utils.fill_background(Colors.WHITE)
             if self.active_scene: self.active_scene.run()
 
+        @self.fixed_update()
+        def _():
+            if self.active_scene: self.active_scene.fixed_run()
+
         self.globals = None
 
         # Threads
         self.threads = []
-        self.terminal_allow = True
+        self.terminal_allow = not self.headless
         self.running = False
 
         NovaEngine.Engine = self
@@ -141,35 +184,7 @@ class NovaEngine:
 
         self.running = True
         while self.running:
-            # base functional
-            self.keys_pressed = pygame.key.get_pressed()
-            self.mouse_clicked = self.MouseClicked(first_iter=True)
-            self.time = pygame.time.get_ticks()
-            if not self.time_froze:
-                self.in_game_time = self.time - self.time_spent_frozed
-
-            if self.main_run_func:
-                self.main_run_func()
-
-            if self.debug:
-                from .utils import Utils
-                Utils.render_text(
-                    f"{round(self.clock.get_fps(), 2)}", 20, 20, center=True
-                )
-                Utils.render_text(
-                    str(pygame.mouse.get_pos()),
-                    *pygame.mouse.get_pos(),
-                    size=10,
-                    center=True,
-                )
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.quit()                
-                for handler in self.event_handlers:
-                    handler.handle_event(event)
-
-            pygame.display.flip()
+            self._frame(pygame.time.get_ticks())
             self.dt = self.clock.tick(self.fps) / 1000
 
         # Saving data to save
@@ -177,6 +192,91 @@ class NovaEngine:
         if save_manager is not None:
             save_manager.save()
 
+    def _frame(self, now, poll_events=True, present=True):
+        """Run one frame: input, simulation, main function, events and display."""
+        prof = self.profiler
+        prof.start_frame()
+
+        if self.dirty_rendering:
+            self._restore_background()
+
+        # base functional
+        with prof.section("input"):
+            self.keys_pressed = pygame.key.get_pressed()
+            self.mouse_clicked = self.MouseClicked(first_iter=True)
+        if self.net_clients:
+            with prof.section("network"):
+                for client in self.net_clients:
+                    client.poll()
+        self.time = now
+        if not self.time_froze:
+            self.in_game_time = self.time - self.time_spent_frozed
+            with prof.section("timers"):
+                self.scheduler.run(self.in_game_time)
+
+        if self.fixed_timestep:
+            with prof.section("fixed_update"):
+                self._run_fixed_steps()
+
+        if self.main_run_func:
+            with prof.section("main"):
+                self.main_run_func()
+
+        if self.debug:
+            from .utils import Utils
+            Utils.render_text(
+                f"{round(self.clock.get_fps(), 2)}", 20, 20, center=True, glyphs=True
+            )
+            Utils.render_text(
+                str(pygame.mouse.get_pos()),
+                *pygame.mouse.get_pos(),
+                size=10,
+                center=True,
+                glyphs=True,
+            )
+
+            if prof.overlay:
+                prof.draw_overlay()
+
+        if poll_events:
+            with prof.section("events"):
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        self.quit()
+                    for handler in self.event_handlers:
+                        handler.handle_event(event)
+
+        with prof.section("display"):
+            self._present(present)
+
+        prof.end_frame()
+
+    def step(self, n_frames=1, dt=None):
+        """
+        Advance the game by `n_frames` frames without the clock and event loop.
+
+        Every frame takes exactly `dt` seconds of game time (default `1 / fps`),
+        so runs are deterministic and as fast as the machine allows.
+        Useful for tests, benchmarks and servers (see `headless`).
+
+        Args:
+            n_frames (int): Number of frames to run.
+            dt (float | None): Frame duration in seconds.
+
+        Returns:
+            NovaEngine: Returns self for chaining.
+        """
+        if dt is None:
+            dt = 1 / self.fps
+
+        if not self.active_scene and self.scenes:
+            self.active_scene = self.scenes[0]
+
+        for _ in range(n_frames):
+            self.dt = dt
+            self._frame(self.time + dt * 1000, poll_events=False, present=not self.headless)
+        return self
+
     def quit(self):
         """Stop engine and exit program."""
         self.running = False
@@ -191,6 +291,54 @@ class NovaEngine:
 
         return decorator
 
+    def fixed_update(self):
+        """Decorator to register simulation logic run at fixed tick rate (see `set_fixed_timestep`)."""
+
+        def decorator(func):
+            self.fixed_run_func = func
+            return func
+
+        return decorator
+
+    def set_fixed_timestep(self, tick_rate=120, max_steps=5, value=True):
+        """
+        Enable or disable fixed-timestep simulation.
+
+        Each frame the `fixed_update` function runs as many times as needed
+        to keep up `tick_rate` steps per second (with `dt` equal to `1 / tick_rate`),
+        then the `main` function renders. At most `max_steps` steps run per frame,
+        the rest of the backlog is dropped, so slow frames can't spiral.
+        `alpha` tells how far the render is between the last two steps.
+        """
+        self.fixed_timestep = value
+        self.tick_rate = tick_rate
+        self.fixed_dt = 1 / tick_rate
+        self.max_steps = max(int(max_steps), 1)
+        self._accumulator = 0.0
+        self.alpha = 0.0
+        return self
+
+    def _run_fixed_steps(self):
+        """Run pending simulation steps for the time of the last frame."""
+        frame_dt = self.dt
+        step = self.fixed_dt
+        self._accumulator += frame_dt
+
+        self.dt = step
+        steps = 0
+        while self._accumulator >= step and steps < self.max_steps:
+            if self.fixed_run_func:
+                self.fixed_run_func()
+            self._accumulator -= step
+            steps += 1
+
+        if self._accumulator >= step:
+            # too far behind: drop backlog instead of catching up forever
+            self._accumulator %= step
+
+        self.dt = frame_dt
+        self.alpha = self._accumulator / step
+
     def new_thread(self):
         """Decorator to run function in a separate daemon thread."""
 
@@ -202,9 +350,129 @@ class NovaEngine:
 
         return decorator
 
-    def set_debug(self, value=True):
-        """Enable or disable debug rendering (FPS, mouse pos)."""
+    def set_debug(self, value=True, profile=False):
+        """
+        Enable or disable debug rendering (FPS, mouse pos).
+
+        With `profile=True` the frame profiler is enabled as well and its
+        per-phase timings are drawn on screen (see `NovaEngine.profiler`).
+        """
         self.debug = value
+        self.profiler.overlay = value and profile
+        if profile:
+            self.profiler.enable(value)
+        return self
+
+    # ========================
+    # RENDERING
+    # ========================
+
+    def set_dirty_rendering(self, value=True):
+        """
+        Enable or disable dirty-rect rendering.
+
+        Instead of refilling and flipping the whole screen every frame, the
+        engine restores the cached background only under areas drawn last
+        frame and sends just the changed areas to `pygame.display.update`.
+        Everything drawn outside engine helpers must be reported with `mark_dirty()`.
+        """
+        self.dirty_rendering = value
+        self._drawn.clear()
+        self._drawn_prev.clear()
+        self._full_redraw = True
+        return self
+
+    def set_background(self, background):
+        """
+        Set cached background used by dirty-rect rendering.
+
+        Args:
+            background (pygame.Surface | tuple): Image or RGB color.
+        """
+        if background is self._bg_key or background == self._bg_key:
+            return
+
+        surf = pygame.Surface(self.screen.get_size())
+        if isinstance(background, pygame.Surface):
+            surf.blit(background, (0, 0))
+        else:
+            surf.fill(background)
+
+        self._bg_key = background
+        self.background = surf
+        self.screen.blit(surf, (0, 0))
+        self._full_redraw = True
+
+    def mark_dirty(self, rect, key=None):
+        """
+        Report an area drawn this frame (dirty-rect rendering only).
+
+        Args:
+            rect (pygame.Rect): Drawn screen area.
+            key: Hashable description of what was drawn. Area with the same
+                 rect and key as last frame is treated as unchanged.
+                 None means "always changed".
+        """
+        if self.dirty_rendering:
+            self._drawn.append((rect, key))
+
+    def _restore_background(self):
+        """Erase everything drawn last frame with the cached background."""
+        bg = self.background
+        if bg is None:
+            return
+        blit = self.screen.blit
+        for rect, _ in self._drawn_prev:
+            blit(bg, rect, rect)
+
+    def _dirty_regions(self):
+        """Get screen areas changed since previous frame."""
+        prev = {(tuple(r), k) for r, k in self._drawn_prev if k is not None}
+        cur = {(tuple(r), k) for r, k in self._drawn if k is not None}
+
+        rects = [r for r, k in self._drawn_prev if k is None or (tuple(r), k) not in cur]
+        rects += [r for r, k in self._drawn if k is None or (tuple(r), k) not in prev]
+        return rects
+
+    def _present(self, present=True):
+        """
+        Finish the frame: show it on the display and rotate the dirty-rect lists.
+
+        Args:
+            present (bool): Update the display (False in headless `step()`,
+                the dirty-rect bookkeeping still runs).
+        """
+        if not self.dirty_rendering:
+            if present:
+                pygame.display.flip()
+            return
+
+        if self._drawn_scene is not self.active_scene:
+            self._drawn_scene = self.active_scene
+            self._full_redraw = True
+
+        if present:
+            if self._full_redraw:
+                pygame.display.flip()
+            else:
+                pygame.display.update(self._dirty_regions())
+        self._full_redraw = False
+
+        self._drawn_prev, self._drawn = self._drawn, self._drawn_prev
+        self._drawn.clear()
+
+    def pause_cooldowns(self):
+        """Pause all live cooldowns (used by Time.time_freeze)."""
+        self.cooldowns_paused = True
+        for cd in list(self.cooldowns):
+            cd.pause()
+        return self
+
+    def resume_cooldowns(self):
+        """Resume all live cooldowns (used by Time.time_unfreeze)."""
+        self.cooldowns_paused = False
+        for cd in list(self.cooldowns):
+            cd.resume()
         return self
 
     # ========================
@@ -5,6 +5,8 @@ from .sprite import Sprite
 
 
 class Button(Sprite):
+    screen_space = True
+
     def __init__(self, img_path, width=None, height=None):
         super().__init__(img_path, width=width, height=height)
 
@@ -57,6 +59,8 @@ class ToggleButton(Button):
 
 
 class TextLabel(Sprite):
+    screen_space = True
+
     def __init__(
         self,
         text="",
@@ -138,6 +142,8 @@ class TextLabel(Sprite):
 class TextInput(Sprite):
     """Поле для введення тексту, як в Tkinter Entry."""
 
+    screen_space = True
+
     def __init__(
         self,
         width=200,
@@ -173,9 +179,10 @@ class TextInput(Sprite):
 
     def draw(self):
         # фон
-        pygame.draw.rect(
+        drawn = pygame.draw.rect(
             self.surface, self.bg_color, (self.x, self.y, self.width, self.height)
         )
+        self.engine.mark_dirty(drawn, ("input", self.bg_color))
         # текст
         from .utils import Utils
         text_rect = Utils.render_text(
@@ -193,6 +200,8 @@ class TextInput(Sprite):
 
 
 class CheckBox(Sprite):
+    screen_space = True
+
     def __init__(
         self,
         width=20,
@@ -217,6 +226,7 @@ class CheckBox(Sprite):
         return self.state
 
     def draw(self):
+        self.engine.mark_dirty(self.rect.copy(), ("checkbox", self.state))
         pygame.draw.rect(self.surface, (0, 0, 0), self.rect, 2)
         if self.state:
             pygame.draw.line(
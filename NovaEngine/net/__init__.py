@@ -0,0 +1,13 @@
+"""===== net =====
+Networking for multiplayer games.
+
+NetServer runs an authoritative asyncio server that sends clients
+length-prefixed binary delta snapshots. NetClient receives them on
+background threads and offers interpolation and client-side prediction.
+InterestManager limits what each client receives to its surroundings.
+"""
+
+from .protocol import ProtocolError
+from .server import NetServer, ClientConnection
+from .client import NetClient
+from .interest import InterestManager
@@ -0,0 +1,328 @@
+"""===== net/client.py =====
+Multiplayer client.
+
+Provides the NetClient class: socket I/O runs on background threads, so
+the game loop never waits for the network. Decoded snapshots reach the
+main thread through a deque and are consumed once per frame by `poll()`.
+
+On top of that it offers snapshot interpolation for remote entities and
+client-side prediction with server reconciliation for the local player.
+"""
+
+import socket
+import threading
+import time
+from collections import deque
+from queue import SimpleQueue
+from ..dev_tools import log
+from . import protocol
+
+
+class NetClient:
+    """
+    Connection to a NetServer.
+
+    Usage:
+        client = NetClient("127.0.0.1", 5000).connect()
+
+        @client.predict()
+        def move(fields, data):
+            return {**fields, "x": fields["x"] + data["dx"]}
+
+        client.send_input({"dx": 5})           # applied locally at once
+        client.sync_sprite(player, client.id)  # predicted position
+        client.sync_sprite(enemy, 7)           # interpolated position
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 5000, interp_delay: float = 0.1, buffer_size: int = 32):
+        """
+        Initialize a new client (not connected yet).
+
+        Args:
+            host (str): Server address.
+            port (int): Server port.
+            interp_delay (float): How far behind the server remote entities are shown, in seconds.
+                Should cover about two snapshot intervals.
+            buffer_size (int): Max number of snapshots kept for interpolation.
+        """
+        self.host = host
+        self.port = port
+        self.interp_delay = interp_delay
+
+        self.id = None  # client id assigned by server
+        self.tick_rate = None
+        self.connected = False
+        self.error = None
+
+        self.tick = 0  # tick of the newest snapshot
+        self.state: dict = {}  # newest authoritative world state
+        self.player_id = None  # own entity for prediction (default: client id)
+
+        self.predict_func = None
+        self.predicted: dict | None = None  # own entity fields with pending inputs applied
+        self._pending: deque = deque()  # (seq, data) inputs not confirmed by server
+        self._input_seq = 0
+
+        self._buffer: deque = deque(maxlen=buffer_size)  # (server time, state)
+        self._clock_offset = None  # server time - local time
+
+        self._sock = None
+        self._inbox: deque = deque()  # network thread -> main thread, no locking needed
+        self._outbox = SimpleQueue()  # main/network thread -> sender thread
+        self._states: dict[int, dict] = {}  # tick -> state, delta baselines (network thread)
+
+        self.bytes_received = 0
+
+    # ========================
+    # CONNECTION
+    # ========================
+    def connect(self, timeout: float = 5.0):
+        """
+        Connect and start the network threads.
+
+        Args:
+            timeout (float): Connection timeout in seconds.
+
+        Returns:
+            NetClient: Returns self for chaining.
+        """
+        self._sock = socket.create_connection((self.host, self.port), timeout)
+        self._sock.settimeout(None)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.connected = True
+
+        threading.Thread(target=self._recv_loop, name="NetClient-recv", daemon=True).start()
+        threading.Thread(target=self._send_loop, name="NetClient-send", daemon=True).start()
+
+        from ..core import NovaEngine
+        engine = NovaEngine.Engine
+        if engine is not None and self not in engine.net_clients:
+            engine.net_clients.append(self)  # polled every frame
+        return self
+
+    def close(self):
+        """Disconnect."""
+        if self._sock is not None:
+            self.connected = False
+            self._outbox.put(None)
+            try:
+                self._sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._sock.close()
+            self._sock = None
+
+        from ..core import NovaEngine
+        engine = NovaEngine.Engine
+        if engine is not None and self in engine.net_clients:
+            engine.net_clients.remove(self)
+
+    def _recv_loop(self):
+        frames = protocol.FrameBuffer()
+        try:
+            while True:
+                data = self._sock.recv(65536)
+                if not data:
+                    break
+                self.bytes_received += len(data)
+                for payload in frames.feed(data):
+                    self._handle_message(payload)
+        except (OSError, AttributeError):
+            pass  # socket closed
+        except protocol.DecodeError as e:  # ProtocolError or malformed value
+            self.error = e
+            log(f"Bad data from server: {e}", "NetClient", True)
+        self.connected = False
+        self._outbox.put(None)
+
+    def _send_loop(self):
+        while True:
+            data = self._outbox.get()
+            if data is None:
+                return
+            try:
+                self._sock.sendall(data)
+            except (OSError, AttributeError):
+                self.connected = False
+                return
+
+    def _handle_message(self, payload: bytes):
+        """Decode message on the network thread."""
+        kind = payload[0]
+        if kind == protocol.MSG_HELLO:
+            _, self.id, self.tick_rate = protocol.HELLO.unpack_from(payload)
+        elif kind == protocol.MSG_SNAPSHOT:
+            tick, baseline_tick, last_input, changed, removed = protocol.decode_snapshot(payload)
+            if baseline_tick and baseline_tick not in self._states:
+                return  # baseline unknown, wait for the next snapshot
+            state = protocol.apply_delta(self._states.get(baseline_tick, {}), changed, removed)
+            self._states[tick] = state
+            for old in [t for t in self._states if t < baseline_tick]:
+                del self._states[old]  # server never uses older baselines again
+
+            self._outbox.put(protocol.encode_ack(tick))
+            self._inbox.append((tick, last_input, state, time.perf_counter()))
+
+    # ========================
+    # MAIN THREAD
+    # ========================
+    def poll(self) -> int:
+        """
+        Take snapshots received since last call. Called by the engine every frame.
+
+        Returns:
+            int: Number of new snapshots.
+        """
+        inbox = self._inbox
+        count = 0
+        while inbox:
+            tick, last_input, state, received = inbox.popleft()
+            if tick <= self.tick:
+                continue
+            count += 1
+            self.tick = tick
+            self.state = state
+
+            server_time = tick / self.tick_rate
+            offset = server_time - received
+            if self._clock_offset is None or offset > self._clock_offset:
+                self._clock_offset = offset
+            else:
+                # late packets only pull the estimate back slowly
+                self._clock_offset += (offset - self._clock_offset) * 0.05
+            self._buffer.append((server_time, state))
+
+            self._reconcile(last_input)
+        return count
+
+    def server_time(self) -> float:
+        """Estimated current server time in seconds."""
+        if self._clock_offset is None:
+            return 0.0
+        return time.perf_counter() + self._clock_offset
+
+    # ========================
+    # INTERPOLATION
+    # ========================
+    def interpolate(self, entity_id) -> dict | None:
+        """
+        Fields of a remote entity `interp_delay` seconds in the past,
+        with numbers interpolated between the two surrounding snapshots.
+
+        Returns:
+            dict | None: Fields, or None if the entity is unknown.
+        """
+        buffer = self._buffer
+        if not buffer:
+            return None
+        render_time = self.server_time() - self.interp_delay
+
+        older = newer = None
+        for entry in reversed(buffer):
+            if entry[0] <= render_time:
+                older = entry
+                break
+            newer = entry
+        if older is None:
+            return newer[1].get(entity_id)
+        if newer is None:
+            return older[1].get(entity_id)  # no newer data, don't extrapolate
+
+        a, b = older[1].get(entity_id), newer[1].get(entity_id)
+        if a is None or b is None:
+            return b if a is None else a
+        t = (render_time - older[0]) / (newer[0] - older[0])
+        fields = {}
+        for key, value in b.items():
+            old = a.get(key)
+            if type(value) in (int, float) and type(old) in (int, float):
+                fields[key] = old + (value - old) * t
+            else:
+                fields[key] = value
+        return fields
+
+    # ========================
+    # PREDICTION
+    # ========================
+    def predict(self):
+        """
+        Decorator for `func(fields, data) -> fields` that applies one input
+        to the own entity's fields. Used for prediction and reconciliation,
+        so it must do what the server does with that input.
+        """
+
+        def decorator(func):
+            self.predict_func = func
+            return func
+
+        return decorator
+
+    def send_input(self, data) -> int:
+        """
+        Send input to the server and apply it to the predicted state at once.
+
+        Args:
+            data: Input data (dict, list, str, numbers...).
+
+        Returns:
+            int: Input sequence number.
+        """
+        self._input_seq += 1
+        seq = self._input_seq
+        self._outbox.put(protocol.encode_input(seq, data))
+        if self.predict_func is not None:
+            self._pending.append((seq, data))
+            if self.predicted is not None:
+                self.predicted = self.predict_func(self.predicted, data)
+        return seq
+
+    def _reconcile(self, last_input: int):
+        """Restart prediction from server state and replay unconfirmed inputs."""
+        pending = self._pending
+        while pending and pending[0][0] <= last_input:
+            pending.popleft()
+        if self.predict_func is None:
+            return
+        fields = self.state.get(self.own_id)
+        if fields is None:
+            self.predicted = None
+            return
+        for _, data in pending:
+            fields = self.predict_func(fields, data)
+        self.predicted = fields
+
+    @property
+    def own_id(self):
+        """Id of the local player's entity."""
+        return self.player_id if self.player_id is not None else self.id
+
+    # ========================
+    # SPRITES
+    # ========================
+    def get(self, entity_id) -> dict | None:
+        """
+        Fields to display for an entity: predicted for the own entity,
+        interpolated for the others.
+        """
+        if entity_id == self.own_id and self.predicted is not None:
+            return self.predicted
+        return self.interpolate(entity_id)
+
+    def sync_sprite(self, sprite, entity_id, x: str = "x", y: str = "y"):
+        """
+        Move sprite to the position of a networked entity.
+
+        Args:
+            sprite (Sprite): Sprite to move.
+            entity_id: Entity id.
+            x (str): Field with X position.
+            y (str): Field with Y position.
+
+        Returns:
+            bool: False if entity is unknown.
+        """
+        fields = self.get(entity_id)
+        if fields is None or x not in fields or y not in fields:
+            return False
+        sprite.set_position(fields[x], fields[y])
+        return True
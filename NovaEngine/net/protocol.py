@@ -0,0 +1,214 @@
+"""===== net/protocol.py =====
+Binary wire format of NovaEngine networking.
+
+Every message is a frame: 4-byte big-endian payload length, then the
+payload. The payload starts with one message type byte.
+
+Values (entity ids, fields, inputs) use the tagged encoding from
+`NovaEngine.codec`.
+
+State snapshots are deltas against a baseline the client acknowledged:
+only entities and fields that changed since then are sent.
+"""
+
+import struct
+from ..codec import DecodeError, pack_value, unpack_value
+
+# ========================
+# MESSAGE TYPES
+# ========================
+MSG_HELLO = 1  # server -> client: client id, tick rate
+MSG_SNAPSHOT = 2  # server -> client: delta state snapshot
+MSG_ACK = 3  # client -> server: snapshot tick received
+MSG_INPUT = 4  # client -> server: input sequence number and data
+
+HEADER = struct.Struct("!I")  # frame length
+HELLO = struct.Struct("!BIH")  # type, client id, tick rate
+SNAPSHOT = struct.Struct("!BIIIHH")  # type, tick, baseline tick, last input, changed, removed
+ACK = struct.Struct("!BI")  # type, tick
+INPUT = struct.Struct("!BI")  # type, input sequence
+
+
+class ProtocolError(DecodeError):
+    """Malformed message."""
+
+
+# ========================
+# FRAMING
+# ========================
+def frame(payload: bytes) -> bytes:
+    """Prefix payload with its length."""
+    return HEADER.pack(len(payload)) + payload
+
+
+async def read_frame(reader, max_size: int = 1 << 20) -> bytes:
+    """
+    Read one whole frame from an asyncio stream (waits for partial data).
+
+    Args:
+        reader (asyncio.StreamReader): Stream to read from.
+        max_size (int): Max payload size in bytes.
+
+    Returns:
+        bytes: Payload.
+
+    Raises:
+        asyncio.IncompleteReadError: Connection closed.
+        ProtocolError: Frame is too big or empty.
+    """
+    (size,) = HEADER.unpack(await reader.readexactly(HEADER.size))
+    if not 0 < size <= max_size:
+        raise ProtocolError(f"bad frame size {size}")
+    return await reader.readexactly(size)
+
+
+class FrameBuffer:
+    """Splits a byte stream into frames (for blocking sockets)."""
+
+    def __init__(self, max_size: int = 1 << 20):
+        self.buffer = bytearray()
+        self.max_size = max_size
+
+    def feed(self, data: bytes) -> list[bytes]:
+        """
+        Add received bytes.
+
+        Returns:
+            list[bytes]: Payloads of all complete frames.
+        """
+        buf = self.buffer
+        buf += data
+        frames = []
+        while len(buf) >= HEADER.size:
+            (size,) = HEADER.unpack_from(buf)
+            if not 0 < size <= self.max_size:
+                raise ProtocolError(f"bad frame size {size}")
+            end = HEADER.size + size
+            if len(buf) < end:
+                break
+            frames.append(bytes(buf[HEADER.size:end]))
+            del buf[:end]
+        return frames
+
+
+def _hashable(value):
+    """Lists arrive as lists; entity ids must be usable as dict keys."""
+    return tuple(value) if isinstance(value, list) else value
+
+
+# ========================
+# MESSAGES
+# ========================
+def encode_hello(client_id: int, tick_rate: int) -> bytes:
+    return frame(HELLO.pack(MSG_HELLO, client_id, tick_rate))
+
+
+def encode_ack(tick: int) -> bytes:
+    return frame(ACK.pack(MSG_ACK, tick))
+
+
+def encode_input(seq: int, data) -> bytes:
+    out = bytearray(INPUT.pack(MSG_INPUT, seq))
+    pack_value(out, data)
+    return frame(bytes(out))
+
+
+def decode_input(payload: bytes):
+    """
+    Returns:
+        tuple[int, object]: Input sequence number and data.
+    """
+    if len(payload) < INPUT.size:
+        raise ProtocolError("truncated input")
+    _, seq = INPUT.unpack_from(payload)
+    data, _ = unpack_value(payload, INPUT.size)
+    return seq, data
+
+
+def diff_states(baseline: dict, state: dict):
+    """
+    Compare two world states ({entity id: {field: value}}).
+
+    Entity dicts are treated as immutable: identical objects are skipped
+    without comparing fields.
+
+    Returns:
+        tuple[list, list]: Changed entities as (id, {changed fields}) and removed ids.
+    """
+    changed = []
+    for eid, fields in state.items():
+        old = baseline.get(eid)
+        if old is fields:
+            continue
+        if old is None:
+            changed.append((eid, fields))
+            continue
+        delta = {key: value for key, value in fields.items() if key not in old or old[key] != value}
+        if delta:
+            changed.append((eid, delta))
+    removed = [eid for eid in baseline if eid not in state]
+    return changed, removed
+
+
+def encode_snapshot(tick: int, baseline_tick: int, last_input: int, changed, removed) -> bytes:
+    """
+    Encode a delta snapshot (see `diff_states`).
+
+    Args:
+        tick (int): Server tick of this snapshot.
+        baseline_tick (int): Tick the delta is based on, 0 for a full snapshot.
+        last_input (int): Last input sequence processed for this client.
+        changed (list): (entity id, {field: value}) pairs.
+        removed (list): Removed entity ids.
+
+    Returns:
+        bytes: Framed message.
+    """
+    out = bytearray(SNAPSHOT.pack(MSG_SNAPSHOT, tick, baseline_tick, last_input, len(changed), len(removed)))
+    for eid, fields in changed:
+        pack_value(out, eid)
+        pack_value(out, fields)
+    for eid in removed:
+        pack_value(out, eid)
+    return frame(bytes(out))
+
+
+def decode_snapshot(payload: bytes):
+    """
+    Decode snapshot message.
+
+    Returns:
+        tuple[int, int, int, list, list]: Tick, baseline tick, last input,
+        changed entities and removed ids.
+    """
+    if len(payload) < SNAPSHOT.size:
+        raise ProtocolError("truncated snapshot")
+    _, tick, baseline_tick, last_input, n_changed, n_removed = SNAPSHOT.unpack_from(payload)
+    offset = SNAPSHOT.size
+    changed, removed = [], []
+    for _ in range(n_changed):
+        eid, offset = unpack_value(payload, offset)
+        fields, offset = unpack_value(payload, offset)
+        if not isinstance(fields, dict):
+            raise ProtocolError("entity fields must be a dict")
+        changed.append((_hashable(eid), fields))
+    for _ in range(n_removed):
+        eid, offset = unpack_value(payload, offset)
+        removed.append(_hashable(eid))
+    return tick, baseline_tick, last_input, changed, removed
+
+
+def apply_delta(baseline: dict, changed, removed) -> dict:
+    """
+    Build new world state from a baseline state and a delta.
+
+    Returns:
+        dict: New state (baseline is not modified).
+    """
+    state = dict(baseline)
+    for eid, fields in changed:
+        old = state.get(eid)
+        state[eid] = {**old, **fields} if old is not None else fields
+    for eid in removed:
+        state.pop(eid, None)
+    return state
@@ -0,0 +1,376 @@
+"""===== net/server.py =====
+Asyncio multiplayer server.
+
+Provides the NetServer class: clients connect over TCP, send inputs and
+acknowledge snapshots; the server runs a fixed tick and sends every client
+only what changed since the last snapshot that client acknowledged.
+"""
+
+import asyncio
+from collections import OrderedDict
+from ..dev_tools import log
+from . import protocol
+
+
+class ClientConnection:
+    """Server-side state of one connected client."""
+
+    def __init__(self, client_id: int, reader, writer):
+        self.id = client_id
+        self.reader = reader
+        self.writer = writer
+        self.address = writer.get_extra_info("peername")
+        self.data = {}  # free slot for game data (player entity id, name, ...)
+
+        # Interest management (see InterestManager)
+        self.focus = None  # entity the area of interest follows (default: client id)
+        self.budget = None  # bytes per tick, None uses the manager's budget
+        self.priority_acc = {}  # entity id -> accumulated priority
+
+        self.acked_tick = 0  # last snapshot tick the client confirmed
+        self.history: OrderedDict[int, dict] = OrderedDict()  # tick -> state sent at that tick
+        self.last_input = 0  # last input sequence processed
+        self._sent_input = 0  # last input sequence reported in a snapshot
+
+        self.bytes_sent = 0
+        self.snapshots_sent = 0
+        self.snapshots_skipped = 0  # skipped because of back-pressure
+
+    @property
+    def buffered(self) -> int:
+        """Bytes waiting in the socket write buffer."""
+        transport = self.writer.transport
+        return transport.get_write_buffer_size() if transport is not None else 0
+
+    def send(self, data: bytes):
+        """Queue raw framed data."""
+        self.writer.write(data)
+        self.bytes_sent += len(data)
+
+    def close(self):
+        """Close connection."""
+        if not self.writer.is_closing():
+            self.writer.close()
+
+
+class NetServer:
+    """
+    Authoritative game server with delta snapshots.
+
+    World state is a dict {entity id: {field: value}}. Entity dicts are
+    replaced (never changed in place) by `set_entity`, so unchanged
+    entities are skipped without comparing their fields.
+
+    Usage:
+        server = NetServer(port=5000, tick_rate=20)
+
+        @server.on_input()
+        def handle(client, seq, data):
+            server.set_entity(client.id, text=data["text"])
+
+        server.run()
+    """
+
+    def __init__(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 5000,
+        tick_rate: int = 20,
+        max_buffer: int = 64 * 1024,
+        max_message: int = 64 * 1024,
+        history: int = 64,
+        interest=None,
+    ):
+        """
+        Initialize a new server.
+
+        Args:
+            host (str): Address to listen on.
+            port (int): Port to listen on (0 picks a free port).
+            tick_rate (int): Ticks (snapshots) per second.
+            max_buffer (int): Skip snapshots to a client while more than this many bytes wait to be sent.
+            max_message (int): Max size of a client message in bytes.
+            history (int): Number of sent snapshots kept per client as delta baselines.
+            interest (InterestManager | None): Replicate only relevant entities to each client.
+        """
+        self.host = host
+        self.port = port
+        self.tick_rate = tick_rate
+        self.max_buffer = max_buffer
+        self.max_message = max_message
+        self.history = history
+        self.interest = interest
+
+        self.entities: dict = {}
+        self.clients: dict[int, ClientConnection] = {}
+        self.tick = 0
+
+        self.connect_func = None
+        self.disconnect_func = None
+        self.input_func = None
+        self.tick_func = None
+
+        self._next_id = 1
+        self._server = None
+        self._tick_task = None
+        self._handlers = set()  # tasks serving connected clients
+
+    # ========================
+    # DECORATORS
+    # ========================
+    def on_connect(self):
+        """Decorator for `func(client)` called when a client connects."""
+
+        def decorator(func):
+            self.connect_func = func
+            return func
+
+        return decorator
+
+    def on_disconnect(self):
+        """Decorator for `func(client)` called when a client disconnects."""
+
+        def decorator(func):
+            self.disconnect_func = func
+            return func
+
+        return decorator
+
+    def on_input(self):
+        """Decorator for `func(client, seq, data)` called for every client input."""
+
+        def decorator(func):
+            self.input_func = func
+            return func
+
+        return decorator
+
+    def on_tick(self):
+        """Decorator for `func(dt)` called every tick before snapshots are sent."""
+
+        def decorator(func):
+            self.tick_func = func
+            return func
+
+        return decorator
+
+    # ========================
+    # WORLD STATE
+    # ========================
+    def set_entity(self, entity_id, **fields):
+        """
+        Create entity or update its fields.
+
+        Returns:
+            NetServer: Returns self for chaining.
+        """
+        old = self.entities.get(entity_id)
+        if old is None:
+            self.entities[entity_id] = fields
+        elif any(key not in old or old[key] != value for key, value in fields.items()):
+            self.entities[entity_id] = {**old, **fields}
+        return self
+
+    def remove_entity(self, entity_id):
+        """
+        Remove entity (clients get it in the next snapshot).
+
+        Returns:
+            NetServer: Returns self for chaining.
+        """
+        self.entities.pop(entity_id, None)
+        return self
+
+    def get_entity(self, entity_id) -> dict | None:
+        """Get fields of an entity (don't modify the returned dict)."""
+        return self.entities.get(entity_id)
+
+    def set_interest(self, interest):
+        """
+        Set interest manager (None sends every entity to every client).
+
+        Returns:
+            NetServer: Returns self for chaining.
+        """
+        self.interest = interest
+        return self
+
+    # ========================
+    # LIFECYCLE
+    # ========================
+    async def start(self):
+        """
+        Start listening and ticking (in the running event loop).
+
+        Returns:
+            NetServer: Returns self for chaining.
+        """
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._tick_task = asyncio.create_task(self._tick_loop())
+        log(f"Listening on {self.host}:{self.port}", "NetServer")
+        return self
+
+    async def stop(self):
+        """Stop ticking, disconnect clients and close the listening socket."""
+        if self._tick_task is not None:
+            self._tick_task.cancel()
+            self._tick_task = None
+        for client in list(self.clients.values()):
+            client.close()
+        if self._handlers:
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def serve_forever(self):
+        """Start and run until cancelled."""
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    def run(self):
+        """Run server in a new event loop (blocks, Ctrl+C to stop)."""
+        try:
+            asyncio.run(self.serve_forever())
+        except KeyboardInterrupt:
+            pass
+
+    # ========================
+    # CONNECTIONS
+    # ========================
+    async def _handle_client(self, reader, writer):
+        client = ClientConnection(self._next_id, reader, writer)
+        self._next_id += 1
+        task = asyncio.current_task()
+        self._handlers.add(task)
+        self.clients[client.id] = client
+        client.send(protocol.encode_hello(client.id, self.tick_rate))
+
+        try:
+            if self.connect_func:
+                self.connect_func(client)
+            while True:
+                payload = await protocol.read_frame(reader, self.max_message)
+                try:
+                    self._handle_message(client, payload)
+                except (protocol.DecodeError, RecursionError):
+                    raise  # malformed data, drop the client below
+                except Exception as e:
+                    log(e, "NetServer", True)  # error in game code, drop only this message
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass  # client disconnected
+        except (protocol.DecodeError, RecursionError) as e:  # ProtocolError or malformed value
+            log(f"Client {client.id} sent bad data: {e}", "NetServer", True)
+        except Exception as e:
+            log(e, "NetServer", True)  # connect handler failed, drop the client
+        finally:
+            self._handlers.discard(task)
+            self.clients.pop(client.id, None)
+            client.close()
+            if self.disconnect_func:
+                try:
+                    self.disconnect_func(client)
+                except Exception as e:
+                    log(e, "NetServer", True)
+
+    def _handle_message(self, client: ClientConnection, payload: bytes):
+        kind = payload[0]
+        if kind == protocol.MSG_ACK:
+            if len(payload) < protocol.ACK.size:
+                raise protocol.ProtocolError("truncated ack")
+            _, tick = protocol.ACK.unpack_from(payload)
+            if client.acked_tick < tick <= self.tick and tick in client.history:
+                client.acked_tick = tick
+                # older baselines are never needed again
+                while next(iter(client.history)) < tick:
+                    client.history.popitem(last=False)
+        elif kind == protocol.MSG_INPUT:
+            seq, data = protocol.decode_input(payload)
+            if seq > client.last_input:  # drop duplicates and reordered inputs
+                client.last_input = seq
+                if self.input_func:
+                    self.input_func(client, seq, data)
+        else:
+            raise protocol.ProtocolError(f"unknown message type {kind}")
+
+    # ========================
+    # TICK
+    # ========================
+    async def _tick_loop(self):
+        loop = asyncio.get_running_loop()
+        interval = 1 / self.tick_rate
+        next_tick = loop.time()
+        while True:
+            next_tick += interval
+            self.tick += 1
+            try:
+                if self.tick_func:
+                    self.tick_func(interval)
+                if self.interest is not None:
+                    self.interest.update(self.entities)
+                self.broadcast()
+            except Exception as e:
+                log(f"Tick {self.tick} failed: {e}", "NetServer", True)
+
+            delay = next_tick - loop.time()
+            if delay < -interval:
+                next_tick = loop.time()  # too far behind, don't try to catch up
+            await asyncio.sleep(max(delay, 0))
+
+    def client_state(self, client: ClientConnection) -> dict:
+        """
+        World state replicated to `client` (all entities without an interest manager).
+
+        Returns:
+            dict: {entity id: fields}.
+        """
+        if self.interest is not None:
+            return self.interest.client_state(self, client)
+        return self.entities
+
+    def broadcast(self):
+        """Send a snapshot of the current tick to every client."""
+        for client in list(self.clients.values()):
+            self.send_snapshot(client)
+
+    def send_snapshot(self, client: ClientConnection) -> bool:
+        """
+        Send delta against the client's acknowledged baseline.
+
+        Nothing is sent when the client already has everything, or while
+        its write buffer is full (the next delta still covers the skipped one).
+
+        Returns:
+            bool: True if a snapshot was sent.
+        """
+        if client.writer.is_closing():
+            return False
+        if client.buffered > self.max_buffer:
+            client.snapshots_skipped += 1
+            return False
+
+        state = dict(self.client_state(client))
+        baseline_tick = client.acked_tick
+        baseline = client.history.get(baseline_tick, {}) if baseline_tick else {}
+        if baseline_tick and baseline_tick not in client.history:
+            baseline_tick = 0  # baseline dropped from history, send full state
+
+        if client.history and client.last_input == client._sent_input:
+            latest = client.history[next(reversed(client.history))]
+            if protocol.diff_states(latest, state) == ([], []):
+                return False  # client has (or will get) this state already
+
+        changed, removed = protocol.diff_states(baseline, state)
+        client.send(protocol.encode_snapshot(self.tick, baseline_tick, client.last_input, changed, removed))
+        client._sent_input = client.last_input
+        client.snapshots_sent += 1
+
+        client.history[self.tick] = state
+        while len(client.history) > self.history:
+            client.history.popitem(last=False)
+        return True
@@ -0,0 +1,304 @@
+"""===== particles.py =====
+Module for pooled particles and bullets.
+
+Provides the ParticlePool class: thousands of short-lived objects stored
+in contiguous arrays (positions, velocities, lifetimes) instead of one
+Sprite each. Dead slots are recycled, movement and off-screen kill are
+vectorized with NumPy when it is installed, and all particles are drawn
+with a single batched blit.
+"""
+
+import math
+from array import array
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+
+class ParticlePool:
+    """
+    Fixed-capacity pool of particles (or bullets) sharing one image.
+
+    Can be added to a Scene like a sprite.
+
+    Usage:
+        bullets = ParticlePool(2000, size=(4, 4), color=(255, 200, 0), lifetime=2)
+        scene.add_sprite(bullets)
+        bullets.emit_angle(x, y, angle=30, speed=600)
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1000,
+        image: pygame.Surface | str | None = None,
+        size: tuple[int, int] = (4, 4),
+        color=(255, 255, 255),
+        lifetime: float = 1.0,
+        kill_offscreen: bool = True,
+        use_numpy: bool | None = None,
+    ):
+        """
+        Initialize a new pool.
+
+        Args:
+            capacity (int): Max number of live particles.
+            image (pygame.Surface | str | None): Particle image or path; None draws a `color` rect.
+            size (tuple[int, int]): Particle size (image is scaled to it if given as path).
+            color (tuple): Color of the default image.
+            lifetime (float): Default lifetime in seconds.
+            kill_offscreen (bool): Kill particles that leave the screen (or camera view).
+            use_numpy (bool | None): Force NumPy on/off (default: use it if installed).
+        """
+        from .core import NovaEngine
+        from .sprite import Sprite
+
+        self.engine = NovaEngine.Engine
+        self.surface = self.engine.screen
+        self.alive = True
+        self.solid = False
+        self.scene = None
+        self.layer = 0
+
+        Sprite._counter += 1
+        self.count = Sprite._counter
+
+        if isinstance(image, str):
+            from .assets import AssetManager
+            image = AssetManager.load_image(image, *size)
+        elif image is None:
+            image = pygame.Surface(size)
+            image.fill(color)
+        self.image = image
+        self.half_w = image.get_width() / 2
+        self.half_h = image.get_height() / 2
+
+        self.capacity = capacity
+        self.lifetime = lifetime
+        self.kill_offscreen = kill_offscreen
+        self.bounds: pygame.Rect | None = None  # kill area, None = screen / camera view
+
+        self.use_numpy = np is not None if use_numpy is None else (use_numpy and np is not None)
+        if self.use_numpy:
+            self.x = np.zeros(capacity, np.float32)
+            self.y = np.zeros(capacity, np.float32)
+            self.vx = np.zeros(capacity, np.float32)
+            self.vy = np.zeros(capacity, np.float32)
+            self.life = np.zeros(capacity, np.float32)
+            self.active = np.zeros(capacity, bool)
+        else:
+            self.x = array("f", bytes(4 * capacity))
+            self.y = array("f", bytes(4 * capacity))
+            self.vx = array("f", bytes(4 * capacity))
+            self.vy = array("f", bytes(4 * capacity))
+            self.life = array("f", bytes(4 * capacity))
+            self.active = bytearray(capacity)
+
+        self._free = list(range(capacity - 1, -1, -1))  # stack of free slots
+
+    # ========================
+    # SPAWNING
+    # ========================
+    def emit(self, x: float, y: float, vx: float = 0, vy: float = 0, lifetime: float | None = None) -> int:
+        """
+        Spawn a particle centered at (x, y) moving with (vx, vy) pixels per second.
+
+        Returns:
+            int: Slot index, -1 if the pool is full.
+        """
+        if not self._free:
+            return -1
+        i = self._free.pop()
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.life[i] = self.lifetime if lifetime is None else lifetime
+        self.active[i] = 1
+        return i
+
+    def emit_angle(self, x: float, y: float, angle: float, speed: float, lifetime: float | None = None) -> int:
+        """
+        Spawn a particle moving in direction `angle` (degrees, same as Sprite.angle).
+
+        Returns:
+            int: Slot index, -1 if the pool is full.
+        """
+        ang = math.radians(angle + 90)
+        return self.emit(x, y, math.sin(ang) * speed, math.cos(ang) * speed, lifetime)
+
+    def kill_particle(self, i: int):
+        """Kill particle in slot `i` and recycle the slot."""
+        if self.active[i]:
+            self.active[i] = 0
+            self._free.append(i)
+
+    def clear(self):
+        """Kill all particles."""
+        if self.use_numpy:
+            self.active[:] = False
+        else:
+            self.active[:] = bytearray(self.capacity)
+        self._free = list(range(self.capacity - 1, -1, -1))
+        return self
+
+    def __len__(self):
+        """Number of live particles."""
+        return self.capacity - len(self._free)
+
+    # ========================
+    # SIMULATION
+    # ========================
+    def _kill_area(self) -> pygame.Rect:
+        if self.bounds is not None:
+            return self.bounds
+        scene = self.scene
+        if scene is not None and scene.camera is not None:
+            return scene.camera.viewport
+        return self.surface.get_rect()
+
+    def step(self, dt: float):
+        """
+        Move particles, age them and kill expired or off-screen ones.
+
+        Args:
+            dt (float): Time step in seconds.
+        """
+        if len(self._free) == self.capacity:
+            return
+        area = self._kill_area()
+
+        if self.use_numpy:
+            act = self.active
+            self.x += self.vx * dt
+            self.y += self.vy * dt
+            self.life -= dt
+            dead = self.life <= 0
+            if self.kill_offscreen:
+                dead |= (
+                    (self.x < area.left - self.half_w)
+                    | (self.x > area.right + self.half_w)
+                    | (self.y < area.top - self.half_h)
+                    | (self.y > area.bottom + self.half_h)
+                )
+            dead &= act
+            if dead.any():
+                act &= ~dead
+                self._free.extend(np.flatnonzero(dead).tolist())
+            return
+
+        x, y, vx, vy, life, act = self.x, self.y, self.vx, self.vy, self.life, self.active
+        left, right = area.left - self.half_w, area.right + self.half_w
+        top, bottom = area.top - self.half_h, area.bottom + self.half_h
+        offscreen = self.kill_offscreen
+        free = self._free
+        for i in range(self.capacity):
+            if not act[i]:
+                continue
+            px = x[i] = x[i] + vx[i] * dt
+            py = y[i] = y[i] + vy[i] * dt
+            life[i] -= dt
+            if life[i] <= 0 or (offscreen and not (left <= px <= right and top <= py <= bottom)):
+                act[i] = 0
+                free.append(i)
+
+    def collide_rect(self, rect, kill: bool = True) -> int:
+        """
+        Count particles inside a world rect (e.g. bullets hitting an enemy).
+
+        Args:
+            rect (pygame.Rect | tuple): World rect.
+            kill (bool): Kill particles that hit.
+
+        Returns:
+            int: Number of hits.
+        """
+        rect = pygame.Rect(rect)
+        if self.use_numpy:
+            hit = (
+                self.active
+                & (self.x + self.half_w >= rect.left)
+                & (self.x - self.half_w < rect.right)
+                & (self.y + self.half_h >= rect.top)
+                & (self.y - self.half_h < rect.bottom)
+            )
+            hits = np.flatnonzero(hit)
+            if kill and len(hits):
+                self.active[hits] = False
+                self._free.extend(hits.tolist())
+            return len(hits)
+
+        left, right = rect.left - self.half_w, rect.right + self.half_w
+        top, bottom = rect.top - self.half_h, rect.bottom + self.half_h
+        hits = 0
+        for i in range(self.capacity):
+            if self.active[i] and left <= self.x[i] < right and top <= self.y[i] < bottom:
+                hits += 1
+                if kill:
+                    self.kill_particle(i)
+        return hits
+
+    # ========================
+    # RENDERING
+    # ========================
+    def _positions(self):
+        """Top-left screen positions of live particles."""
+        hw, hh = self.half_w, self.half_h
+        if self.use_numpy:
+            idx = np.flatnonzero(self.active)
+            return zip((self.x[idx] - hw).tolist(), (self.y[idx] - hh).tolist())
+        x, y = self.x, self.y
+        return [(x[i] - hw, y[i] - hh) for i in range(self.capacity) if self.active[i]]
+
+    def draw(self):
+        """
+        Draw all live particles with one batched blit.
+
+        Returns:
+            ParticlePool: Returns self for chaining.
+        """
+        if not self.alive or len(self._free) == self.capacity:
+            return self
+
+        scene = self.scene
+        camera = scene.camera if scene is not None else None
+        img = self.image
+        if camera is not None:
+            img = camera.scale_image(img)
+            seq = [(img, camera.to_screen(px, py)) for px, py in self._positions()]
+        else:
+            seq = [(img, pos) for pos in self._positions()]
+
+        if scene is not None and scene.batching and scene._updating:
+            scene._batch.extend(seq)
+        elif self.engine.dirty_rendering:
+            for rect in self.surface.blits(seq):
+                self.engine.mark_dirty(rect)
+        else:
+            self.surface.blits(seq, False)
+        return self
+
+    def fixed_update(self):
+        """Simulation step in fixed-timestep mode."""
+        if self.alive:
+            self.step(self.engine.fixed_dt)
+
+    def update(self):
+        """Step (unless engine runs fixed timestep) and draw particles."""
+        if not self.alive:
+            return
+        if not self.engine.fixed_timestep:
+            self.step(self.engine.dt)
+        self.draw()
+
+    def kill(self):
+        """
+        Mark pool as dead (not drawn, removed from scene).
+
+        Returns:
+            ParticlePool: Returns self for chaining.
+        """
+        self.alive = False
+        return self
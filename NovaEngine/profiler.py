@@ -0,0 +1,213 @@
+"""===== profiler.py =====
+Frame profiler.
+
+Provides the Profiler class, which measures how long each phase of a frame
+takes (input, main function, scenes, per-class update/draw, events, display),
+keeps a rolling history with percentiles, draws an on-screen overlay and
+exports traces in Chrome trace format (chrome://tracing, Perfetto).
+"""
+
+import json
+from collections import deque
+from time import perf_counter
+
+
+class _NullSection:
+    """Context manager that does nothing (profiler disabled)."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _Section:
+    """Context manager that times a block and reports it to the profiler."""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, self.start)
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class Profiler:
+    """
+    Per-frame timing of engine phases.
+
+    Usage:
+        engine.profiler.enable()
+        with engine.profiler.section("ai"):
+            ...
+        print(engine.profiler.stats())
+    """
+
+    def __init__(self, history: int = 300, trace_limit: int = 200_000):
+        """
+        Args:
+            history (int): Number of frames kept for percentiles.
+            trace_limit (int): Max number of recorded trace events.
+        """
+        self.enabled = False
+        self.overlay = False  # draw stats on screen (see NovaEngine.set_debug)
+        self.history = history
+        self.trace_limit = trace_limit
+
+        self.samples: dict[str, deque] = {}  # name -> per-frame durations (ms)
+        self._frame: dict[str, float] = {}  # name -> duration in current frame (ms)
+        self._frame_start = 0.0
+
+        self.tracing = False
+        self.trace_events: list[dict] = []
+        self._origin = perf_counter()
+
+    # ========================
+    # CONTROL
+    # ========================
+    def enable(self, value: bool = True):
+        """Enable or disable recording."""
+        self.enabled = value
+        if not value:
+            self._frame.clear()
+        return self
+
+    def reset(self):
+        """Forget all collected samples and trace events."""
+        self.samples.clear()
+        self._frame.clear()
+        self.trace_events.clear()
+        return self
+
+    def start_trace(self):
+        """Start recording trace events (enables profiler)."""
+        self.enable()
+        self.tracing = True
+        self.trace_events.clear()
+        return self
+
+    def stop_trace(self):
+        """Stop recording trace events."""
+        self.tracing = False
+        return self
+
+    # ========================
+    # RECORDING
+    # ========================
+    def section(self, name: str):
+        """
+        Context manager timing a block under `name`.
+
+        Returns:
+            Context manager (does nothing when profiler is disabled).
+        """
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Section(self, name)
+
+    def add(self, name: str, start: float, end: float | None = None):
+        """
+        Record a timed block.
+
+        Args:
+            name (str): Phase name. Blocks with the same name add up within a frame.
+            start (float): `time.perf_counter()` at block start.
+            end (float | None): `time.perf_counter()` at block end (default: now).
+        """
+        if end is None:
+            end = perf_counter()
+        ms = (end - start) * 1000
+        self._frame[name] = self._frame.get(name, 0.0) + ms
+
+        if self.tracing and len(self.trace_events) < self.trace_limit:
+            self.trace_events.append({
+                "name": name,
+                "ph": "X",
+                "ts": (start - self._origin) * 1_000_000,
+                "dur": ms * 1000,
+                "pid": 0,
+                "tid": 0,
+            })
+
+    def start_frame(self):
+        """Called by engine at the start of every frame."""
+        if self.enabled:
+            self._frame_start = perf_counter()
+
+    def end_frame(self):
+        """Called by engine at the end of every frame: stores frame samples."""
+        if not self.enabled:
+            return
+        self.add("frame", self._frame_start)
+
+        for name, ms in self._frame.items():
+            samples = self.samples.get(name)
+            if samples is None:
+                samples = self.samples[name] = deque(maxlen=self.history)
+            samples.append(ms)
+        self._frame.clear()
+
+    # ========================
+    # RESULTS
+    # ========================
+    def stats(self) -> dict[str, dict[str, float]]:
+        """
+        Get percentiles of every phase over the rolling history.
+
+        Returns:
+            dict: name -> {"p50", "p95", "p99", "mean", "frames"} in milliseconds.
+        """
+        result = {}
+        for name, samples in self.samples.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            n = len(ordered)
+            result[name] = {
+                "p50": ordered[min(n - 1, int(n * 0.50))],
+                "p95": ordered[min(n - 1, int(n * 0.95))],
+                "p99": ordered[min(n - 1, int(n * 0.99))],
+                "mean": sum(ordered) / n,
+                "frames": n,
+            }
+        return result
+
+    def export_trace(self, path: str):
+        """
+        Write recorded trace events to a Chrome-trace JSON file.
+
+        Args:
+            path (str): Output file path.
+
+        Returns:
+            int: Number of written events.
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.trace_events, "displayTimeUnit": "ms"}, f)
+        return len(self.trace_events)
+
+    def draw_overlay(self, x: int = 10, y: int = 40, rows: int = 12):
+        """Draw slowest phases (by p95) on screen."""
+        from .utils import Utils
+
+        stats = sorted(self.stats().items(), key=lambda kv: kv[1]["p95"], reverse=True)
+        Utils.render_text("phase  p50 / p95 / p99 ms", x, y, size=12, glyphs=True)
+        for i, (name, st) in enumerate(stats[:rows], start=1):
+            Utils.render_text(
+                f"{name}  {st['p50']:.2f} / {st['p95']:.2f} / {st['p99']:.2f}",
+                x,
+                y + i * 14,
+                size=12,
+                glyphs=True,
+            )
@@ -1,12 +1,18 @@
 """===== saves.py ====="""
 
-import json, os
+import json, os, struct, zlib
+from operator import attrgetter
 from pathlib import Path
-import inspect
+from . import codec
 
 class SaveManager:
     """
-    A manager class for saving and loading object attributes to JSON.
+    A manager class for saving and loading object attributes.
+
+    Save files use a small versioned binary format: a header (magic,
+    format version, flags) followed by the values encoded with
+    `NovaEngine.codec`, optionally zlib-compressed. Old hex/JSON save
+    files are still loaded.
 
     Example usage:
         save_manager = SaveManager()
@@ -15,16 +21,22 @@ class SaveManager:
         save_manager.load()
     """
 
-    def __init__(self, appdata: bool = True, path:str = None, name:str = "data"):
+    MAGIC = b"NOVA"
+    VERSION = 1
+    HEADER = struct.Struct("!4sBB")  # magic, format version, flags
+    FLAG_ZLIB = 1
+
+    def __init__(self, appdata: bool = True, path:str = None, name:str = "data", compress: bool = True):
         """
         Initialize SaveManager.
 
         Args:
             appdata (bool): If True, saves data in OS-specific appdata folder.
                             If False, saves in current working directory.
-            path (str): If $appdata$ is False, SaveManager will create folder with saves in $path$ directory. 
+            path (str): If $appdata$ is False, SaveManager will create folder with saves in $path$ directory.
                   If $appdata$ is True, then in AppData folder will be created $path$.
             name (str): the name of save file.
+            compress (bool): Compress save file with zlib.
 
         """
         from .core import NovaEngine
@@ -32,8 +44,9 @@ class SaveManager:
         self.engine = NovaEngine.Engine
         self.path = path
         self.name = name
+        self.compress = compress
 
-        if self.path is None: 
+        if self.path is None:
             self.path = self.engine.app_name
 
         # Choose directory depending on OS
@@ -47,14 +60,17 @@ class SaveManager:
             self.main_dir = self.path
 
         os.makedirs(self.main_dir, exist_ok=True)
-        
+
         if self.name:
             self.data_file = os.path.join(self.main_dir, f"{name}.novasave")
         else:
             self.data_file = os.path.join(self.main_dir, "data.json")
 
         self.vars: list[str] = []
-    
+        self._accessors = []  # (path, getter, setter) compiled in set_vars
+        self._globals = None  # globals of __main__, found once
+        self._cache: dict | None = None  # values of the save file, None until read
+
     def _get_globals(self) -> dict:
         """
         Get the caller's global variables.
@@ -63,62 +79,150 @@ class SaveManager:
         Returns:
             dict: The global scope of the caller.
         """
-        from .dev_tools import get_globals
-        return get_globals()
+        if self._globals is None:
+            from .dev_tools import get_globals
+            g = get_globals()
+            if not g:
+                return g  # no __main__ yet, try again next time
+            self._globals = g
+        return self._globals
 
     def set_vars(self, vars: list[str]):
         """
         Set which attributes should be saved/loaded.
 
+        Paths are compiled once into accessors here, so `save()` and
+        `load()` don't parse them again.
+
         Args:
             vars (list[str]): A list of attribute paths (e.g. ["player.hp", "player.money"])
         """
         self.vars = vars
+        self._accessors = [(key, *self._compile(key)) for key in vars]
         return self
 
+    @staticmethod
+    def _compile(key: str):
+        """
+        Build getter and setter for an attribute path.
+
+        Returns:
+            tuple[Callable, Callable]: getter(globals) and setter(globals, value).
+        """
+        root, *attrs = key.split(".")
+        if not attrs:
+            # просто змінна у глобалах
+            def getter(g):
+                return g[root]
+
+            def setter(g, value):
+                g[root] = value
+
+            return getter, setter
+
+        get_value = attrgetter(".".join(attrs))
+        get_parent = attrgetter(".".join(attrs[:-1])) if len(attrs) > 1 else None
+        last = attrs[-1]
+
+        def getter(g):
+            return get_value(g[root])
+
+        def setter(g, value):
+            obj = g[root]
+            if get_parent is not None:
+                obj = get_parent(obj)
+            setattr(obj, last, value)
+
+        return getter, setter
+
     def save(self) -> dict:
         """
-        Save selected attributes to JSON.
+        Save selected attributes to the save file.
 
         Example:
             self.vars = ["player.hp", "player.money"]
-            -> creates JSON file like:
-               {"player.hp": 100, "player.money": 250}
+            -> saves {"player.hp": 100, "player.money": 250}
 
         Returns:
             dict: The dictionary of saved values.
+
+        Raises:
+            codec.EncodeError: A value can't be saved (unsupported type, too big or nested too deeply).
         """
         g = self._get_globals()
         values = {}
 
-        for key in self.vars:
-            parts = key.split(".")
-            if len(parts) == 1:
-                # просто змінна у глобалах
-                if parts[0] in g:
-                    values[key] = g[parts[0]]
-            else:
-                obj = g.get(parts[0])
-                if obj is None:
-                    continue
-                for attr in parts[1:]:
-                    obj = getattr(obj, attr, None)
-                    if obj is None:
-                        break
-                if obj is not None:
-                    values[key] = obj
-
-        json_str = json.dumps(values)
-        hex_str = json_str.encode("utf-8").hex()
-
-        with open(self.data_file, "w") as f:
-            f.write(hex_str)
+        for key, getter, _ in self._accessors:
+            try:
+                values[key] = getter(g)
+            except (KeyError, AttributeError):
+                continue
+
+        try:
+            payload = codec.dumps(values)
+        except codec.EncodeError as e:
+            raise codec.EncodeError(f"Can't save '{self._bad_key(values)}': {e}") from None
+        flags = 0
+        if self.compress:
+            payload = zlib.compress(payload)
+            flags |= self.FLAG_ZLIB
+
+        # write to a temporary file first, a crash can't leave a broken save
+        tmp_file = self.data_file + ".tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(self.HEADER.pack(self.MAGIC, self.VERSION, flags))
+            f.write(payload)
+        os.replace(tmp_file, self.data_file)
+
+        self._cache = values
+        return values
+
+    @staticmethod
+    def _bad_key(values: dict):
+        """Find the value that failed to encode (for the error message)."""
+        for key, value in values.items():
+            try:
+                codec.dumps(value)
+            except codec.EncodeError:
+                return key
+        return None
 
+    def _read(self) -> dict:
+        """
+        Read values from the save file (binary or old hex/JSON format).
+
+        Returns:
+            dict: Saved values, empty if there is no file.
+        """
+        if not os.path.exists(self.data_file):
+            return {}
+
+        with open(self.data_file, "rb") as f:
+            data = f.read()
+
+        if data.startswith(self.MAGIC):
+            _, version, flags = self.HEADER.unpack_from(data)
+            if version > self.VERSION:
+                raise ValueError(f"save format version {version} is newer than supported {self.VERSION}")
+            payload = data[self.HEADER.size:]
+            if flags & self.FLAG_ZLIB:
+                payload = zlib.decompress(payload)
+            values = codec.loads(payload)
+        else:
+            text = data.decode("utf-8").strip()
+            try:
+                text = bytes.fromhex(text).decode("utf-8")  # old hex format
+            except ValueError:
+                pass  # plain JSON
+            values = json.loads(text)
+
+        if not isinstance(values, dict):
+            raise ValueError("save file doesn't contain a dictionary")
         return values
 
     def load(self) -> dict:
         """
-        Load saved attributes from JSON and apply them to objects.
+        Load saved attributes from the save file and apply them to objects.
 
         Example:
             self.vars = ["player.hp", "player.money"]
@@ -127,47 +231,39 @@ class SaveManager:
         Returns:
             dict: The dictionary of loaded values.
         """
-        if not os.path.exists(self.data_file):
-            return {}
-
-        with open(self.data_file, "r") as f:
-            hex_str = f.read().strip()
-
         try:
-            json_str = bytes.fromhex(hex_str).decode("utf-8")
-            values = json.loads(json_str)
+            values = self._read()
         except Exception as e:
             print("Помилка завантаження:", e)
             return
+        self._cache = values
 
         g = self._get_globals()
-        for key in self.vars:
+        for key, _, setter in self._accessors:
             if key not in values:
                 continue
-
-            parts = key.split(".")
-            if len(parts) == 1:
-                # просто змінна
-                g[parts[0]] = values[key]
-            else:
-                obj = g.get(parts[0])
-                if obj is None:
-                    continue
-                for attr in parts[1:-1]:
-                    obj = getattr(obj, attr, None)
-                    if obj is None:
-                        break
-                if obj is not None:
-                    setattr(obj, parts[-1], values[key])
+            try:
+                setter(g, values[key])
+            except (KeyError, AttributeError):
+                continue
 
         return values
-    
+
     def get_value(self, var:str):
-        if not os.path.exists(self.data_file):
-            return None
-        with open(self.data_file, "r", encoding="utf-8") as f:
-            values = json.load(f)
+        """
+        Get saved value without applying it (the file is read only once).
+
+        Args:
+            var (str): Attribute path, e.g. "player.hp".
+
+        Returns:
+            Any: Saved value or None.
+        """
+        if self._cache is None:
+            try:
+                self._cache = self._read()
+            except Exception as e:
+                print("Помилка завантаження:", e)
+                return None
 
-        if var not in values: return None
-            
-        return values.get(var, None)
\ No newline at end of file
+        return self._cache.get(var, None)
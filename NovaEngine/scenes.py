@@ -1,8 +1,13 @@
 """===== scenes.py ====="""
 
+import pygame
 from contextlib import contextmanager
+from time import perf_counter
 from .sprite import Sprite, Group
 from .core import NovaEngine
+from .spatial import SpatialHash, rect_in_radius, sweep_rect
+from .tilemap import Tilemap
+from .particles import ParticlePool
 
 class Scene:
     """
@@ -10,17 +15,33 @@ class Scene:
     - Holds all sprites, buttons, players, etc.
     - Manages solid objects for collision detection.
     - Provides context manager for automatic sprite registration.
+    - Keeps a spatial index of sprites for fast collision queries.
     """
 
-    def __init__(self):
+    def __init__(self, cell_size: int = 64, name: str | None = None):
         """
         Initialize a new scene.
+
+        Args:
+            cell_size (int): Cell size of the collision broadphase grid.
+            name (str | None): Scene name (used by profiler).
         """
         
         self.engine = NovaEngine.Engine
+        self.name = name or f"Scene{len(self.engine.scenes)}"
         self.objects = []  # all sprites in scene
         self.solids = []  # only solid sprites
+        self.tilemaps = []  # tilemaps, their solid tiles block like solids
+        self._members = set()  # O(1) membership of self.objects
+        self._pending_removal = set()  # removed during update, compacted after it
+        self._updating = False
+        self._layers_dirty = False  # objects need re-sorting by layer
+        self.batching = False
+        self._batch = []  # (image, position) queued for current layer
+        self.index = SpatialHash(cell_size)  # broadphase of scene sprites
+        self.camera = None  # Camera, None draws in screen coordinates
         self.run = self.update  # main update function
+        self.fixed_run = self.fixed_update  # fixed-timestep simulation function
 
         # Register scene in engine
         self.engine.scenes.append(self)
@@ -32,9 +53,54 @@ class Scene:
         """Add sprites to the scene manually."""
         sprites_list = list(sprites)
         for obj in sprites_list:
-            self.objects.append(obj)
-            if getattr(obj, "solid", False):
-                self.solids.append(obj)
+            self._register(obj)
+
+    def remove_sprite(self, *sprites):
+        """
+        Remove sprites from the scene.
+
+        During `update()` and `fixed_update()` removal is deferred until the pass ends,
+        so iteration over `objects` stays valid.
+        """
+        for obj in sprites:
+            if obj in self._members:
+                self._pending_removal.add(obj)
+        if not self._updating:
+            self._compact()
+
+    def _register(self, obj):
+        """Add object to scene lists and to the spatial index."""
+        if obj in self._members:
+            return
+        self._members.add(obj)
+        if self.objects and getattr(obj, "layer", 0) < getattr(self.objects[-1], "layer", 0):
+            self._layers_dirty = True
+        self.objects.append(obj)
+        if getattr(obj, "solid", False):
+            self.solids.append(obj)
+        if hasattr(obj, "scene"):
+            obj.scene = self  # camera, batching and culling go through the scene
+        if isinstance(obj, Sprite):
+            self.index.insert(obj)
+        elif isinstance(obj, Tilemap):
+            self.tilemaps.append(obj)
+
+    def _compact(self):
+        """Drop all pending removed objects in one pass."""
+        removed = self._pending_removal
+        if not removed:
+            return
+
+        self.objects[:] = [obj for obj in self.objects if obj not in removed]
+        self.solids[:] = [obj for obj in self.solids if obj not in removed]
+        self.tilemaps[:] = [obj for obj in self.tilemaps if obj not in removed]
+        for obj in removed:
+            self._members.discard(obj)
+            if isinstance(obj, Sprite):
+                self.index.remove(obj)
+            if getattr(obj, "scene", None) is self:
+                obj.scene = None
+        removed.clear()
 
     @contextmanager
     def sprites(self):
@@ -59,14 +125,183 @@ class Scene:
 
         for name in new_vars:
             obj = after_vars[name]
-            if isinstance(obj, (Sprite, Group)):
-                self.objects.append(obj)
-                if getattr(obj, "solid", False):
-                    self.solids.append(obj)
+            if isinstance(obj, (Sprite, Group, Tilemap, ParticlePool)):
+                self._register(obj)
         
-        self.objects.sort(key=lambda o: getattr(o, "count", 0))
+        self.objects.sort(key=lambda o: (getattr(o, "layer", 0), getattr(o, "count", 0)))
+        self._layers_dirty = False
         self.solids.sort(key=lambda o: getattr(o, "count", 0))
 
+    # ========================
+    # CAMERA
+    # ========================
+    def set_camera(self, camera):
+        """
+        Attach a camera: sprites are drawn through its transform and
+        objects outside its viewport are not drawn.
+
+        Args:
+            camera (Camera | None): Camera, None to draw in screen coordinates.
+
+        Returns:
+            Scene: Returns self for chaining.
+        """
+        self.camera = camera
+        return self
+
+    # ========================
+    # LAYERS AND BATCHING
+    # ========================
+    def set_batching(self, value: bool = True):
+        """
+        Enable or disable batched drawing.
+
+        In batch mode sprites don't blit immediately: their images are
+        collected per layer and sent to the screen with one `Surface.blits`
+        call when the layer ends. Anything drawn immediately (text, shapes)
+        ends up under batched sprites of the same layer, so keep GUI on its own layer.
+
+        Returns:
+            Scene: Returns self for chaining.
+        """
+        self.batching = value
+        return self
+
+    def _sort_layers(self):
+        """Stable sort of objects by layer (creation order inside a layer is kept)."""
+        self.objects.sort(key=lambda o: getattr(o, "layer", 0))
+        self._layers_dirty = False
+
+    def _flush_batch(self):
+        """Blit queued sprite images of the current layer."""
+        batch = self._batch
+        if not batch:
+            return
+
+        engine = self.engine
+        if engine.dirty_rendering:
+            rects = engine.screen.blits(batch)
+            for (img, _), rect in zip(batch, rects):
+                engine.mark_dirty(rect, img)
+        else:
+            engine.screen.blits(batch, False)
+        batch.clear()
+
+    # ========================
+    # SPATIAL QUERIES
+    # ========================
+    def query_rect(self, rect, solids: bool = False, exclude=None) -> list:
+        """
+        Get alive sprites whose rect overlaps `rect`.
+
+        Args:
+            rect (pygame.Rect | tuple): Area to check.
+            solids (bool): Only return solid sprites.
+            exclude (Sprite | None): Sprite to skip (usually the caller).
+
+        Returns:
+            list[Sprite]: Overlapping sprites in creation order.
+        """
+        rect = pygame.Rect(rect)
+        found = [
+            obj
+            for obj in self.index.query(rect)
+            if obj is not exclude
+            and obj.alive
+            and (not solids or obj.solid)
+            and rect.colliderect(obj.rect)
+        ]
+        found.sort(key=lambda o: o.count)
+        return found
+
+    def query_radius(self, point: tuple[float, float], r: float, solids: bool = False, exclude=None) -> list:
+        """
+        Get alive sprites whose rect intersects a circle.
+
+        Args:
+            point (tuple[float, float]): Circle center.
+            r (float): Circle radius.
+            solids (bool): Only return solid sprites.
+            exclude (Sprite | None): Sprite to skip.
+
+        Returns:
+            list[Sprite]: Intersecting sprites in creation order.
+        """
+        px, py = point
+        area = (int(px - r), int(py - r), int(2 * r) + 2, int(2 * r) + 2)
+        found = [
+            obj
+            for obj in self.index.query(area)
+            if obj is not exclude
+            and obj.alive
+            and (not solids or obj.solid)
+            and rect_in_radius(pygame.Rect(obj.rect), point, r)
+        ]
+        found.sort(key=lambda o: o.count)
+        return found
+
+    def collide_any(self, rect, solids: bool = False, exclude=None) -> bool:
+        """
+        Check if any alive sprite or solid tile overlaps `rect`.
+
+        Args:
+            rect (pygame.Rect | tuple): Area to check.
+            solids (bool): Only check solid sprites.
+            exclude (Sprite | None): Sprite to skip.
+
+        Returns:
+            bool: True if something overlaps.
+        """
+        rect = pygame.Rect(rect)
+        for obj in self.index.query(rect):
+            if (
+                obj is not exclude
+                and obj.alive
+                and (not solids or obj.solid)
+                and rect.colliderect(obj.rect)
+            ):
+                return True
+        for tilemap in self.tilemaps:
+            if tilemap.alive and tilemap.collide_rect(rect):
+                return True
+        return False
+
+    def sweep(self, rect, dx: float, dy: float, solids: bool = False, exclude=None):
+        """
+        Find the first sprite or solid tile hit by `rect` moving by (dx, dy).
+
+        Only objects near the swept area are tested, so fast movers don't
+        tunnel through thin walls.
+
+        Args:
+            rect (pygame.Rect | tuple): Moving rect at its start position.
+            dx (float): Movement along X.
+            dy (float): Movement along Y.
+            solids (bool): Only check solid sprites.
+            exclude (Sprite | None): Sprite to skip.
+
+        Returns:
+            tuple[float, tuple[int, int], object] | None: Time of impact, hit
+            normal and hit object (sprite or tilemap), or None.
+        """
+        rect = pygame.Rect(rect)
+        area = rect.union(rect.move(dx, dy)).inflate(2, 2)
+        best = None
+        for obj in self.index.query(area):
+            if obj is exclude or not obj.alive or (solids and not obj.solid):
+                continue
+            hit = sweep_rect(rect, dx, dy, obj.rect)
+            if hit is not None and (best is None or (hit[0], obj.count) < (best[0], best[2].count)):
+                best = (hit[0], hit[1], obj)
+        for tilemap in self.tilemaps:
+            if not tilemap.alive:
+                continue
+            for tile in tilemap.solid_rects(area):
+                hit = sweep_rect(rect, dx, dy, tile)
+                if hit is not None and (best is None or hit[0] < best[0]):
+                    best = (hit[0], hit[1], tilemap)
+        return best
+
     # ========================
     # SCENE LOOP
     # ========================
@@ -79,17 +314,75 @@ class Scene:
 
         return decorator
 
+    def fixed_function(self):
+        """Decorator to register the fixed-timestep simulation function for the scene."""
+
+        def decorator(func):
+            self.fixed_run = func
+            return func
+
+        return decorator
+
+    def fixed_update(self):
+        """Call fixed_update() on all scene objects (one simulation step)."""
+        self._updating = True  # removals are deferred, like in update()
+        for obj in self.objects:
+            try:
+                if hasattr(obj, "fixed_update"):
+                    obj.fixed_update()
+                if not getattr(obj, "alive", True):
+                    self._pending_removal.add(obj)
+                elif isinstance(obj, Sprite):
+                    # rect may have been changed directly
+                    self.index.update(obj)
+            except Exception as e:
+                from .core import log
+
+                log(e, "SceneManager", True)
+        self._updating = False
+
+        self._compact()
+
     def update(self):
         """Call update() on all scene objects."""
+        prof = self.engine.profiler
+        if prof.enabled:
+            scene_start = perf_counter()
+
+        if self._layers_dirty:
+            self._sort_layers()
+        if self.camera is not None:
+            self.camera.update()
+
+        self._updating = True
+        batching = self.batching
+        layer = None
         for obj in self.objects:
+            if batching and getattr(obj, "layer", 0) != layer:
+                self._flush_batch()
+                layer = getattr(obj, "layer", 0)
             try:
-                obj.update()
-                if isinstance(obj, Sprite):
-                    if not obj.alive:
-                        self.objects.remove(obj)
-                        self.solids.remove(obj)
+                if prof.enabled:
+                    start = perf_counter()
+                    obj.update()
+                    prof.add(f"update:{type(obj).__name__}", start)
+                else:
+                    obj.update()
+                if not getattr(obj, "alive", True):
+                    self._pending_removal.add(obj)
+                elif isinstance(obj, Sprite):
+                    # rect may have been changed directly
+                    self.index.update(obj)
                     
             except Exception as e:
                 from .core import log
 
                 log(e, "SceneManager", True)
+        self._flush_batch()
+        self._updating = False
+
+        # remove dead sprites once per frame
+        self._compact()
+
+        if prof.enabled:
+            prof.add(f"scene:{self.name}", scene_start)
@@ -0,0 +1,108 @@
+"""===== scheduler.py =====
+Frame-driven timers.
+
+Provides the Scheduler class that runs delayed and repeating callbacks on
+the main thread, once per frame, based on engine's in-game time. Pending
+timers are kept in a heap, so thousands of them cost nothing until due.
+"""
+
+import heapq
+from itertools import count as _counter
+
+
+class TimerHandle:
+    """Handle of a scheduled callback. Use `cancel()` to stop it."""
+
+    __slots__ = ("func", "when", "interval", "remaining", "cancelled")
+
+    def __init__(self, func, when, interval=None, remaining=1):
+        self.func = func
+        self.when = when  # in-game time in ms
+        self.interval = interval  # ms between calls, None for one-shot
+        self.remaining = remaining  # calls left, -1 for infinite
+        self.cancelled = False
+
+    def cancel(self):
+        """Stop the timer. Safe to call more than once."""
+        self.cancelled = True
+        return self
+
+    @property
+    def active(self):
+        """True while the callback is still going to be called."""
+        return not self.cancelled and self.remaining != 0
+
+
+class Scheduler:
+    """
+    Heap of pending callbacks keyed on in-game time (ms).
+
+    `run(now)` is called by the engine every frame and calls every
+    callback that is due. Repeating callbacks run at most once per frame.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._seq = _counter()  # tie-breaker for equal times
+
+    def call_at(self, when, func, interval=None, count=1) -> TimerHandle:
+        """
+        Schedule `func` at in-game time `when` (ms).
+
+        Args:
+            when (float): In-game time in ms.
+            func (Callable): Callback without arguments.
+            interval (float | None): Repeat every `interval` ms.
+            count (int): Number of calls for repeating timers (-1 for infinite).
+
+        Returns:
+            TimerHandle: Handle for cancellation.
+        """
+        handle = TimerHandle(func, when, interval, count if interval is not None else 1)
+        if handle.remaining != 0:
+            heapq.heappush(self._heap, (when, next(self._seq), handle))
+        return handle
+
+    def run(self, now):
+        """
+        Call all callbacks due at in-game time `now` (ms).
+
+        Returns:
+            int: Number of called callbacks.
+        """
+        heap = self._heap
+        repeat = []
+        called = 0
+
+        while heap and heap[0][0] <= now:
+            _, _, handle = heapq.heappop(heap)
+            if handle.cancelled:
+                continue
+
+            if handle.remaining > 0:
+                handle.remaining -= 1
+            try:
+                handle.func()
+            except Exception as e:
+                from .dev_tools import log
+
+                log(e, "Scheduler", True)
+            called += 1
+
+            if handle.interval is not None and handle.active:
+                handle.when = max(handle.when + handle.interval, now)
+                repeat.append(handle)
+
+        for handle in repeat:
+            heapq.heappush(heap, (handle.when, next(self._seq), handle))
+        return called
+
+    def clear(self):
+        """Cancel all pending callbacks."""
+        for _, _, handle in self._heap:
+            handle.cancelled = True
+        self._heap.clear()
+
+    def __len__(self):
+        """Number of pending (not cancelled) callbacks."""
+        return sum(1 for _, _, handle in self._heap if not handle.cancelled)
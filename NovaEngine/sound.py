@@ -2,16 +2,40 @@
 
 import pygame
 
-pygame.mixer.init()
-
 class SoundManager:
     sounds = {}
     music_playing = False
+    _mixer_failed = False  # mixer init failed once, don't retry and log again
+
+    @staticmethod
+    def _mixer():
+        """
+        Initialize the mixer on first use, not at import: the engine sets
+        the audio driver (dummy in headless mode) before that.
+
+        Returns:
+            bool: True if the mixer is available.
+        """
+        if pygame.mixer.get_init():
+            return True
+        if SoundManager._mixer_failed:
+            return False
+        try:
+            pygame.mixer.init()
+        except pygame.error as e:
+            # no audio device (e.g. headless server)
+            from .dev_tools import log
+
+            SoundManager._mixer_failed = True
+            log(e, "SoundManager", True)
+            return False
+        return True
 
     @staticmethod
     def load_sound(name, path):
         """Load sounds and give it a name"""
-        SoundManager.sounds[name] = pygame.mixer.Sound(path)
+        if SoundManager._mixer():
+            SoundManager.sounds[name] = pygame.mixer.Sound(path)
 
     @staticmethod
     def play_sound(name, volume=1.0, count=1):
@@ -28,6 +52,8 @@ class SoundManager:
     @staticmethod
     def play_music(path, volume=1.0, loop=-1):
         """Play music in background"""
+        if not SoundManager._mixer():
+            return
         pygame.mixer.music.load(path)
         pygame.mixer.music.set_volume(volume)
         pygame.mixer.music.play(loop)
@@ -36,22 +62,26 @@ class SoundManager:
     @staticmethod
     def stop_music():
         """Stops music, that is currently playing"""
-        pygame.mixer.music.stop()
+        if SoundManager._mixer():
+            pygame.mixer.music.stop()
         SoundManager.music_playing = False
 
     @staticmethod
     def pause_music():
         """Pauses music"""
-        pygame.mixer.music.pause()
+        if SoundManager._mixer():
+            pygame.mixer.music.pause()
 
     @staticmethod
     def continue_music():
         """Continues playing music"""
-        pygame.mixer.music.unpause()
+        if SoundManager._mixer():
+            pygame.mixer.music.unpause()
 
     @staticmethod
     def stop_all():
         """Stops all playing sounds"""
-        pygame.mixer.stop()
-        pygame.mixer.music.stop()
+        if SoundManager._mixer():
+            pygame.mixer.stop()
+            pygame.mixer.music.stop()
         SoundManager.music_playing = False
@@ -0,0 +1,195 @@
+"""===== spatial.py =====
+Broadphase index for fast rect queries.
+
+Provides the SpatialHash class: a uniform grid that maps cells to the
+objects whose rects overlap them, so collision queries only look at
+nearby objects instead of scanning the whole scene.
+"""
+
+import math
+import pygame
+
+
+class SpatialHash:
+    """
+    Uniform grid (spatial hash) of objects with a `rect`.
+
+    Objects are stored in every cell their rect overlaps. `update()` is
+    incremental: if an object stays inside the same cells, nothing changes.
+    """
+
+    def __init__(self, cell_size: int = 64):
+        """
+        Initialize an empty grid.
+
+        Args:
+            cell_size (int): Size of one grid cell in pixels.
+        """
+        self.cell_size = max(int(cell_size), 1)
+        self.cells: dict[tuple[int, int], set] = {}
+        self._bounds: dict = {}  # obj -> (x0, y0, x1, y1) cell range
+
+    def _cell_range(self, rect) -> tuple[int, int, int, int]:
+        cs = self.cell_size
+        x0, y0 = rect[0] // cs, rect[1] // cs
+        x1 = (rect[0] + max(rect[2], 1) - 1) // cs
+        y1 = (rect[1] + max(rect[3], 1) - 1) // cs
+        return x0, y0, x1, y1
+
+    def insert(self, obj):
+        """
+        Add object to the grid (or refresh its cells if already present).
+
+        Args:
+            obj: Any object with a `rect` attribute.
+        """
+        self.update(obj)
+
+    def update(self, obj):
+        """
+        Move object to the cells covered by its current rect.
+
+        Args:
+            obj: Any object with a `rect` attribute.
+        """
+        bounds = self._cell_range(obj.rect)
+        old = self._bounds.get(obj)
+        if old == bounds:
+            return
+        if old is not None:
+            self._discard(obj, old)
+
+        self._bounds[obj] = bounds
+        cells = self.cells
+        x0, y0, x1, y1 = bounds
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cells[(cx, cy)] = {obj}
+                else:
+                    cell.add(obj)
+
+    def remove(self, obj):
+        """
+        Remove object from the grid. Unknown objects are ignored.
+
+        Args:
+            obj: Object previously inserted.
+        """
+        old = self._bounds.pop(obj, None)
+        if old is not None:
+            self._discard(obj, old)
+
+    def _discard(self, obj, bounds):
+        cells = self.cells
+        x0, y0, x1, y1 = bounds
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell is not None:
+                    cell.discard(obj)
+                    if not cell:
+                        del cells[(cx, cy)]
+
+    def query(self, rect) -> set:
+        """
+        Get candidate objects whose cells overlap `rect`.
+
+        Candidates are not tested for an actual overlap.
+
+        Args:
+            rect (pygame.Rect | tuple): Query area.
+
+        Returns:
+            set: Candidate objects.
+        """
+        cells = self.cells
+        x0, y0, x1, y1 = self._cell_range(rect)
+
+        if x0 == x1 and y0 == y1:
+            return set(cells.get((x0, y0), ()))
+
+        found = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        return found
+
+    def clear(self):
+        """Remove all objects."""
+        self.cells.clear()
+        self._bounds.clear()
+
+    def __contains__(self, obj):
+        return obj in self._bounds
+
+    def __len__(self):
+        return len(self._bounds)
+
+
+def rect_in_radius(rect: pygame.Rect, point: tuple[float, float], radius: float) -> bool:
+    """
+    Check if a rect intersects a circle.
+
+    Args:
+        rect (pygame.Rect): Rectangle.
+        point (tuple[float, float]): Circle center.
+        radius (float): Circle radius.
+
+    Returns:
+        bool: True if they intersect.
+    """
+    px, py = point
+    nx = min(max(px, rect.left), rect.right)
+    ny = min(max(py, rect.top), rect.bottom)
+    dx, dy = px - nx, py - ny
+    return dx * dx + dy * dy <= radius * radius
+
+
+def sweep_rect(rect: pygame.Rect, dx: float, dy: float, target: pygame.Rect):
+    """
+    Swept AABB test: when does `rect` moving by (dx, dy) first touch `target`.
+
+    Rects that already overlap are ignored, so an object can always move
+    out of something it is stuck in.
+
+    Args:
+        rect (pygame.Rect): Moving rect at its start position.
+        dx (float): Movement along X.
+        dy (float): Movement along Y.
+        target (pygame.Rect): Static rect.
+
+    Returns:
+        tuple[float, tuple[int, int]] | None: Time of impact in [0, 1] (part of
+        the movement) and surface normal of the hit side, or None if no hit.
+    """
+    if rect.colliderect(target):
+        return None
+
+    if dx > 0:
+        x_entry, x_exit = (target.left - rect.right) / dx, (target.right - rect.left) / dx
+    elif dx < 0:
+        x_entry, x_exit = (target.right - rect.left) / dx, (target.left - rect.right) / dx
+    elif rect.right <= target.left or rect.left >= target.right:
+        return None
+    else:
+        x_entry, x_exit = -math.inf, math.inf
+
+    if dy > 0:
+        y_entry, y_exit = (target.top - rect.bottom) / dy, (target.bottom - rect.top) / dy
+    elif dy < 0:
+        y_entry, y_exit = (target.bottom - rect.top) / dy, (target.top - rect.bottom) / dy
+    elif rect.bottom <= target.top or rect.top >= target.bottom:
+        return None
+    else:
+        y_entry, y_exit = -math.inf, math.inf
+
+    entry = max(x_entry, y_entry)
+    if entry >= min(x_exit, y_exit) or entry < 0 or entry > 1:
+        return None
+    if x_entry > y_entry:
+        return entry, (-1 if dx > 0 else 1, 0)
+    return entry, (0, -1 if dy > 0 else 1)
@@ -8,7 +8,128 @@ for batch management of multiple sprites.
 
 import math
 import random
+import weakref
+from collections import OrderedDict
+from time import perf_counter
 import pygame
+from .assets import AssetManager
+from .animation import AnimationClip, AnimationState
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+
+_UNCHANGED = object()  # sentinel: keep current setting
+
+
+class RotationCache:
+    """
+    Shared cache of rotated surfaces.
+
+    Rotated images are keyed on the source surface and its angle quantized
+    to `angle_step` degrees. Each source image keeps an LRU of at most
+    `max_angles` rotations, so every sprite drawing the same image reuses
+    the same rotated surfaces. Entries disappear together with their source image.
+    By default the LRU holds a full turn (`ceil(360 / angle_step)`), so a
+    spinning sprite doesn't evict its own rotations.
+
+    Collision masks are cached the same way, one per (image, angle bucket),
+    and are dropped together with their rotated surface.
+    """
+
+    angle_step: float = 1
+    max_angles: int | None = None  # None: a full turn of buckets
+
+    _cache = weakref.WeakKeyDictionary()
+    _masks = weakref.WeakKeyDictionary()  # rotated surface -> pygame.mask.Mask
+
+    @classmethod
+    def configure(cls, angle_step: float | None = None, max_angles=_UNCHANGED):
+        """
+        Change quantization step and LRU bound. Clears the cache.
+
+        Args:
+            angle_step (float | None): Angle quantization in degrees.
+            max_angles (int | None): Max cached rotations per source image
+                (lower it to save memory with big images). None restores
+                the default, a full turn. Left unchanged if not given.
+        """
+        if angle_step is not None:
+            cls.angle_step = max(float(angle_step), 1e-3)
+        if max_angles is not _UNCHANGED:
+            cls.max_angles = None if max_angles is None else max(int(max_angles), 1)
+        cls.clear()
+
+    @classmethod
+    def clear(cls):
+        """Drop all cached rotations and masks."""
+        cls._cache.clear()
+        cls._masks.clear()
+
+    @classmethod
+    def bucket(cls, angle: float) -> float:
+        """
+        Quantize angle to the cache step.
+
+        Returns:
+            float: Angle in range [0, 360), 0 means "not rotated".
+        """
+        step = cls.angle_step
+        return (round(angle / step) * step) % 360
+
+    @classmethod
+    def get(cls, img: pygame.Surface, angle: float) -> pygame.Surface:
+        """
+        Get `img` rotated by `angle` degrees (quantized).
+
+        Args:
+            img (pygame.Surface): Source image.
+            angle (float): Rotation in degrees.
+
+        Returns:
+            pygame.Surface: Cached rotated surface (or `img` itself for 0 degrees).
+        """
+        bucket = cls.bucket(angle)
+        if not bucket:
+            return img
+
+        rotations = cls._cache.get(img)
+        if rotations is None:
+            rotations = cls._cache[img] = OrderedDict()
+
+        rotated = rotations.get(bucket)
+        if rotated is None:
+            rotated = pygame.transform.rotate(img, bucket)
+            rotations[bucket] = rotated
+            if len(rotations) > (cls.max_angles or math.ceil(360 / cls.angle_step)):
+                rotations.popitem(last=False)
+        else:
+            rotations.move_to_end(bucket)
+        return rotated
+
+    @classmethod
+    def get_mask(cls, img: pygame.Surface, angle: float = 0) -> pygame.mask.Mask:
+        """
+        Get collision mask of `img` rotated by `angle` degrees (quantized).
+
+        Masks are built once from the cached surfaces, so don't draw on an
+        image after its mask was used (or call `clear()`).
+
+        Args:
+            img (pygame.Surface): Source image.
+            angle (float): Rotation in degrees.
+
+        Returns:
+            pygame.mask.Mask: Cached mask of the rotated surface.
+        """
+        rotated = cls.get(img, angle)
+        mask = cls._masks.get(rotated)
+        if mask is None:
+            mask = cls._masks[rotated] = pygame.mask.from_surface(rotated)
+        return mask
+
 
 class Sprite:
     """
@@ -25,6 +146,9 @@ class Sprite:
     # Counter for ordering sprite initialization
     _counter = 0
 
+    # True: drawn in screen coordinates, ignoring scene camera (HUD, GUI)
+    screen_space = False
+
     def __init__(
         self,
         img_path: str,
@@ -42,14 +166,16 @@ class Sprite:
             solid (bool): Whether sprite is solid (collidable).
         """
         from .core import NovaEngine
-        from .time import Time
 
         self.engine = NovaEngine.Engine
         self.surface = self.engine.screen
         self.solid = solid
         self.alive = True
+        self.scene = None  # scene whose spatial index holds this sprite
+        self.layer = 0  # draw layer in scene, higher is drawn later
 
         self.update_func = None
+        self.fixed_update_func = None
 
         self.debug_color = (
             random.randint(0, 255),
@@ -63,11 +189,8 @@ class Sprite:
 
         # Load original image (keep for transformations)
         if img_path:
-            self.original_img = pygame.image.load(img_path).convert_alpha()
-            if width and height:
-                self.original_img = pygame.transform.scale(
-                    self.original_img, (width, height)
-                )
+            # shared surface from the asset cache
+            self.original_img = AssetManager.load_image(img_path, width, height)
         else:
             if width and height:
                 self.original_img = pygame.Surface((width, height))
@@ -78,22 +201,39 @@ class Sprite:
         self.height = self.original_img.get_height()
 
         self.collide_immun_time = 0.1
-        self.collide_immun = Time.Cooldown(self.collide_immun_time)
+        self._collide_immun = None  # created on first collide()
 
         # Current image (may be transformed)
         self.img = self.original_img
         self.angle: float = 0
         self.rect = self.img.get_rect()
-        self.x, self.y = self.rect.topleft
-
-        # Animations
-        self.animations: dict[str, dict] = {}
-        self.current_animation: str | None = None
+        self._prev_topleft = None  # position before last fixed step
+
+        # Last rotation result: (source image, angle) -> rotated image
+        self._rot_src = None
+        self._rot_angle = None
+        self._rot_img = None
+        self.x, self.y = self.rect.topleft  # float position, rect is derived from it
+
+        # Animations: own clips (shared clips live on the class) and playback state
+        self.animations: dict[str, AnimationClip] = {}
+        self.anim_state = AnimationState()
+
+    @property
+    def collide_immun(self):
+        """Cooldown between collision checks, created lazily."""
+        if self._collide_immun is None:
+            from .time import Time
+            self._collide_immun = Time.Cooldown(self.collide_immun_time)
+        return self._collide_immun
+
+    @collide_immun.setter
+    def collide_immun(self, cooldown):
+        self._collide_immun = cooldown
 
     def set_collide_immunity(self, duration):
-        from .time import Time
         self.collide_immun_time = duration
-        self.collide_immun = Time.Cooldown(self.collide_immun_time)
+        self._collide_immun = None
 
     def draw(self):
         """
@@ -102,34 +242,96 @@ class Sprite:
         Returns:
             Sprite: Returns self for chaining.
         """
-        if self.alive:
-            rot_data = self._rotate_img()
-            self.surface.blit(rot_data.get("img", self.img), rot_data.get("rect", self.rect).topleft)
+        scene = self.scene
+        camera = None if scene is None or self.screen_space else scene.camera
+
+        if self.alive and (camera is None or camera.visible(self._cull_rect())):
+            prof = self.engine.profiler
+            if prof.enabled:
+                start = perf_counter()
+
+            img, pos = self._rotate_img()
+            if self._prev_topleft is not None and self.engine.fixed_timestep:
+                pos = self._interpolate(pos)
+            if camera is not None:
+                img, pos = camera.apply(img, pos)
+
+            if scene is not None and scene.batching and scene._updating:
+                # blitted together with its layer by Scene
+                scene._batch.append((img, pos))
+            else:
+                drawn = self.surface.blit(img, pos)
+                if self.engine.dirty_rendering:
+                    self.engine.mark_dirty(drawn, img)
+
+            if prof.enabled:
+                prof.add(f"draw:{type(self).__name__}", start)
 
         if self.debug:
             from .utils import Utils
-            pygame.draw.rect(self.surface, self.debug_color, self.rect, 1)
+            rect = self.rect if camera is None else camera.rect_to_screen(self.rect)
+            self.engine.mark_dirty(pygame.draw.rect(self.surface, self.debug_color, rect, 1))
             Utils.render_text(
                 f"{round(self.rect.x)}, {round(self.rect.y)}",
-                self.rect.x,
-                self.rect.y,
+                rect.x,
+                rect.y,
                 size=12,
                 center=True,
             )
         return self
 
+    def _cull_rect(self):
+        """World rect covering the sprite image at any rotation."""
+        rect = self.rect
+        if not self.angle:
+            return rect
+        side = rect.w + rect.h
+        return pygame.Rect(rect.centerx - side // 2, rect.centery - side // 2, side, side)
+
+    def _interpolate(self, pos):
+        """
+        Shift blit position between the last two fixed steps by `engine.alpha`.
+        """
+        px, py = self._prev_topleft
+        cx, cy = self._position()
+        if px == cx and py == cy:
+            return pos
+        a = self.engine.alpha
+        rx, ry = self.rect.topleft
+        return pos[0] + px + (cx - px) * a - rx, pos[1] + py + (cy - py) * a - ry
+
     def _rotate_img(self):
-        rotated_img = pygame.transform.rotate(self.img, self.angle)
-        rotated_rect = rotated_img.get_rect(center=self.rect.center)
+        """
+        Get current image rotated by `angle` and its top-left position,
+        keeping the sprite centered. Uses `RotationCache`.
+
+        Returns:
+            tuple[pygame.Surface, tuple[int, int]]: Image and blit position.
+        """
+        if not self.angle:
+            return self.img, self.rect.topleft
 
-        return {"img": rotated_img, "rect": rotated_rect}
+        if self._rot_src is not self.img or self._rot_angle != self.angle:
+            self._rot_src = self.img
+            self._rot_angle = self.angle
+            self._rot_img = RotationCache.get(self.img, self.angle)
+
+        rotated_img = self._rot_img
+        if rotated_img is self.img:
+            return rotated_img, self.rect.topleft
+
+        cx, cy = self.rect.center
+        return rotated_img, (cx - rotated_img.get_width() // 2, cy - rotated_img.get_height() // 2)
 
     def hover(self, special_point: tuple[float, float] = None):
         """
         If sprite's rect is hovered by mouse, returns True.
         Else, returns False.
         """
-        val = self.rect.collidepoint(pygame.mouse.get_pos())
+        mouse = pygame.mouse.get_pos()
+        if self.scene is not None and self.scene.camera is not None and not self.screen_space:
+            mouse = self.scene.camera.to_world(*mouse)
+        val = self.rect.collidepoint(mouse)
         if special_point:
             try: 
                 val = self.rect.collidepoint(special_point)
@@ -139,6 +341,22 @@ class Sprite:
 
         return val
 
+    def set_layer(self, layer: int):
+        """
+        Set draw layer. Sprites on higher layers are drawn over lower ones.
+
+        Args:
+            layer (int): Layer number (default 0).
+
+        Returns:
+            Sprite: Returns self for chaining.
+        """
+        if layer != self.layer:
+            self.layer = layer
+            if self.scene is not None:
+                self.scene._layers_dirty = True
+        return self
+
     def set_update(self):
         """
         Decorator to set custom update logic for the sprite.
@@ -153,6 +371,20 @@ class Sprite:
 
         return decorator
 
+    def set_fixed_update(self):
+        """
+        Decorator to set custom logic run on each fixed-timestep simulation step.
+
+        Returns:
+            Callable: The decorated function.
+        """
+
+        def decorator(func):
+            self.fixed_update_func = func
+            return func
+
+        return decorator
+
     def set_position(self, x: float | None = None, y: float | None = None):
         """
         Set top-left position of the sprite.
@@ -164,11 +396,8 @@ class Sprite:
         Returns:
             Sprite: Returns self for chaining.
         """
-        if x is not None:
-            self.x = x
-        if y is not None:
-            self.y = y
-        self.rect.topleft = (self.x, self.y)
+        cx, cy = self._position()
+        self._place(cx if x is None else x, cy if y is None else y)
         return self
 
     def place_centered(self, x: float, y: float):
@@ -182,14 +411,16 @@ class Sprite:
         Returns:
             Sprite: Returns self for chaining.
         """
-        self.rect.center = (x, y)
-        self.x, self.y = self.rect.topleft
+        self._place(x - self.rect.w // 2, y - self.rect.h // 2)
         return self
 
     def move(self, dx: float = 0, dy: float = 0):
         """
         Move sprite by (dx, dy).
 
+        Sub-pixel movement is kept in `x`/`y`, so small steps (e.g. `speed * dt`
+        in a fixed update) add up instead of being truncated by the rect.
+
         Args:
             dx (float): Change in X position.
             dy (float): Change in Y position.
@@ -197,10 +428,37 @@ class Sprite:
         Returns:
             Sprite: Returns self for chaining.
         """
-        self.rect.move_ip(dx, dy)
-        self.x, self.y = self.rect.topleft
+        rect = self.rect
+        x, y = self.x, self.y
+        # inlined _position() and _place(), this is the hot path
+        if math.floor(x + 0.5) != rect.x:
+            x = rect.x
+        if math.floor(y + 0.5) != rect.y:
+            y = rect.y
+        x += dx
+        y += dy
+        self.x, self.y = x, y
+        rect.topleft = (math.floor(x + 0.5), math.floor(y + 0.5))
+        self._moved()
         return self
 
+    def _position(self) -> tuple[float, float]:
+        """
+        Float top-left position. If the rect was moved directly, it wins.
+        """
+        rx, ry = self.rect.topleft
+        if math.floor(self.x + 0.5) != rx:
+            self.x = rx
+        if math.floor(self.y + 0.5) != ry:
+            self.y = ry
+        return self.x, self.y
+
+    def _place(self, x: float, y: float):
+        """Set float position and derive the rect from it (rounded)."""
+        self.x, self.y = x, y
+        self.rect.topleft = (math.floor(x + 0.5), math.floor(y + 0.5))
+        self._moved()
+
     def move_to(self, target, speed: float):
         """
         Move sprite towards a target with given speed.
@@ -214,14 +472,13 @@ class Sprite:
         else:
             tx, ty = target
 
-        dx, dy = tx - self.rect.centerx, ty - self.rect.centery
+        x, y = self._position()
+        dx, dy = tx - (x + self.rect.w / 2), ty - (y + self.rect.h / 2)
         dist = math.hypot(dx, dy)
 
         if dist > 0:
-            dx /= dist
-            dy /= dist
-            self.rect.x += dx * speed * self.engine.dt
-            self.rect.y += dy * speed * self.engine.dt
+            k = speed * self.engine.dt / dist
+            self.move(dx * k, dy * k)
 
     def move_angle(self, speed: float):
         """
@@ -250,6 +507,7 @@ class Sprite:
         self.img = pygame.transform.scale(self.img, (width, height))
         self.rect = self.img.get_rect(center=self.rect.center)
         self.x, self.y = self.rect.topleft
+        self._moved()
         return self
 
     def stay_in_rect(self, rect: pygame.Rect):
@@ -262,7 +520,15 @@ class Sprite:
         Returns:
             Sprite: Returns self for chaining.
         """
+        ox, oy = self.rect.topleft
         self.rect.clamp_ip(rect)
+        nx, ny = self.rect.topleft
+        # keep sub-pixel position on axes that weren't clamped
+        if nx != ox:
+            self.x = nx
+        if ny != oy:
+            self.y = ny
+        self._moved()
         return self
 
     def rotate(self, angle: float):
@@ -293,13 +559,14 @@ class Sprite:
         dx, dy = tx - self.rect.centerx, ty - self.rect.centery
         self.angle = -math.degrees(math.atan2(dy, dx))
 
-    def collide(self, other: "Sprite" = None, rect: pygame.Rect = None) -> bool:
+    def collide(self, other: "Sprite" = None, rect: pygame.Rect = None, pixel_perfect: bool = False) -> bool:
         """
         Check collision with another sprite or rect.
 
         Args:
             other (Sprite | None): Another sprite.
             rect (pygame.Rect | None): A rectangle.
+            pixel_perfect (bool): After rects overlap, compare masks (`collide_mask`).
 
         Returns:
             bool: True if collision detected, else False.
@@ -307,26 +574,104 @@ class Sprite:
         if self.collide_immun.check():
             self.collide_immun.start()
             if other and other.alive:
+                if pixel_perfect:
+                    return self.collide_mask(other)
                 return self.rect.colliderect(other.rect)
             if rect:
                 return self.rect.colliderect(rect)                
         return False
 
+    def sweep(self, dx: float, dy: float, targets=None, solids: bool = True):
+        """
+        Continuous collision: first object hit when moving by (dx, dy).
+
+        Unlike `collide_any`, the whole path is checked, so fast sprites
+        can't skip thin walls.
+
+        Args:
+            dx (float): Movement along X.
+            dy (float): Movement along Y.
+            targets (Iterable[Sprite | pygame.Rect] | None): Objects to check
+                (default: sprites and solid tiles of the sprite's scene, or of
+                the active scene if the sprite isn't in one).
+            solids (bool): Only check solid sprites (scene query only).
+
+        Returns:
+            tuple[float, tuple[int, int], object] | None: Time of impact (part
+            of the movement, 0..1), hit normal and hit object, or None.
+        """
+        if targets is None:
+            scene = self.scene if self.scene is not None else self.engine.get_scene()
+            if scene is None:
+                return None
+            return scene.sweep(self.rect, dx, dy, solids=solids, exclude=self)
+
+        from .spatial import sweep_rect
+        best = None
+        for target in targets:
+            if isinstance(target, Sprite):
+                if target is self or not target.alive:
+                    continue
+                hit = sweep_rect(self.rect, dx, dy, target.rect)
+            else:
+                hit = sweep_rect(self.rect, dx, dy, pygame.Rect(target))
+            if hit is not None and (best is None or hit[0] < best[0]):
+                best = (hit[0], hit[1], target)
+        return best
+
+    def move_swept(self, dx: float, dy: float, targets=None, solids: bool = True):
+        """
+        Move by (dx, dy), stopping at the first object in the way.
+
+        Args:
+            dx (float): Change in X position.
+            dy (float): Change in Y position.
+            targets (Iterable[Sprite | pygame.Rect] | None): See `sweep`.
+            solids (bool): See `sweep`.
+
+        Returns:
+            tuple[float, tuple[int, int], object] | None: The hit (see `sweep`) or None.
+        """
+        hit = self.sweep(dx, dy, targets, solids)
+        if hit is None:
+            self.move(dx, dy)
+        else:
+            self.move(dx * hit[0], dy * hit[0])
+        return hit
+
+    @property
+    def mask(self) -> pygame.mask.Mask:
+        """Collision mask of the current (rotated) image, from `RotationCache`."""
+        return RotationCache.get_mask(self.img, self.angle)
+
+    def collide_mask(self, other: "Sprite") -> bool:
+        """
+        Pixel-perfect collision with another sprite (current rotated images).
+
+        Image rects are checked first, masks only when they overlap.
+
+        Args:
+            other (Sprite): Another sprite.
+
+        Returns:
+            bool: True if opaque pixels overlap.
+        """
+        img, (x, y) = self._rotate_img()
+        other_img, (ox, oy) = other._rotate_img()
+        if not img.get_rect(topleft=(x, y)).colliderect(other_img.get_rect(topleft=(ox, oy))):
+            return False
+        return self.mask.overlap(other.mask, (int(ox - x), int(oy - y))) is not None
+
     def collide_any(self, solids=False):
         """
         If Sprite's rect collides with any other sprite's rect in the scene : returns True 
         """
         if self.collide_immun.check():
             self.collide_immun.start()
-            scene = self.engine.get_scene()      
-            objs = scene.objects
-            if solids:
-                objs = scene.solids
-
-            for sp in objs:
-                if sp != self:
-                    if self.rect.colliderect(sp.rect):
-                        return True
+            scene = self.engine.get_scene()
+            if scene is None:
+                return False
+            return scene.collide_any(self.rect, solids=solids, exclude=self)
         return False
 
     def rect_update(self):
@@ -337,9 +682,16 @@ class Sprite:
             pygame.Rect: Updated rect.
         """
         self.rect = self.img.get_rect(topleft=self.rect.topleft)
-        self.x, self.y = self.rect.topleft
+        self._position()
+        self._moved()
         return self.rect
 
+    def _moved(self):
+        """Refresh sprite's cells in the scene spatial index after rect change."""
+        scene = self.scene
+        if scene is not None and self.alive and self in scene._members:
+            scene.index.update(self)  # group members only borrow the scene for drawing
+
     def kill(self):
         """
         Mark sprite as dead (not drawn or updated).
@@ -359,32 +711,92 @@ class Sprite:
             if self.update_func:
                 self.update_func()
 
+    def fixed_update(self):
+        """
+        One fixed-timestep simulation step: remember position for render
+        interpolation and call custom fixed update function.
+        """
+        if self.alive:
+            self._prev_topleft = self._position()
+            if self.fixed_update_func:
+                self.fixed_update_func()
+
     # ====== ANIMATIONS ======
-    def set_animation(self, name: str, frames: list, speed: float = 0.1, loop: bool = True):
+    @property
+    def current_animation(self) -> str | None:
+        """Name the playing animation was registered under."""
+        return self.anim_state.name
+
+    @classmethod
+    def add_animation(cls, name: str, frames, speed: float = 0.1, loop: bool = True):
+        """
+        Register an animation shared by all instances of this sprite class.
+
+        Frames are stored once per class instead of once per sprite.
+
+        Args:
+            name (str): Animation name.
+            frames (Iterable[pygame.Surface] | AnimationClip): Frame surfaces
+                (e.g. from `AssetManager.load_sheet`) or a ready clip.
+            speed (float): Time per frame.
+            loop (bool): Whether animation loops.
+
+        Returns:
+            AnimationClip: The registered clip.
+        """
+        clip = frames if isinstance(frames, AnimationClip) else AnimationClip(name, frames, speed, loop)
+        if "_class_animations" not in cls.__dict__:
+            cls._class_animations = {}
+        cls._class_animations[name] = clip
+        return clip
+
+    def _get_animation(self, name: str | None) -> AnimationClip | None:
+        """Find animation clip: sprite's own first, then its classes'."""
+        if name is None:
+            return None
+        clip = self.animations.get(name)
+        if clip is not None:
+            return clip
+        for klass in type(self).__mro__:
+            shared = klass.__dict__.get("_class_animations")
+            if shared and name in shared:
+                return shared[name]
+        return None
+
+    def _first_animation(self) -> tuple[str, AnimationClip] | None:
+        """First available animation: (name, clip)."""
+        if self.animations:
+            return next(iter(self.animations.items()))
+        for klass in type(self).__mro__:
+            shared = klass.__dict__.get("_class_animations")
+            if shared:
+                return next(iter(shared.items()))
+        return None
+
+    def _set_frame(self, img: pygame.Surface):
+        """Show animation frame, rect is rebuilt only if frame size changes."""
+        self.img = img
+        if img.get_size() != self.rect.size:
+            self.rect_update()
+
+    def set_animation(self, name: str, frames, speed: float = 0.1, loop: bool = True):
         """
         Register a new animation for the sprite.
 
         Args:
             name (str): Animation name.
-            frames (list): List of frame surfaces.
+            frames (list | AnimationClip): List of frame surfaces or a shared clip.
             speed (float): Time per frame.
             loop (bool): Whether animation loops.
 
         Returns:
             Sprite: Returns self for chaining.
         """
-        self.animations[name] = {
-            "frames": frames,
-            "index": 0,
-            "speed": speed,
-            "timer": 0,
-            "loop": loop,
-        }
-
-        if not self.current_animation:
-            self.current_animation = name
-            self.img = frames[0]
-            self.rect_update()
+        clip = frames if isinstance(frames, AnimationClip) else AnimationClip(name, frames, speed, loop)
+        self.animations[name] = clip
+
+        if self.anim_state.clip is None:
+            self._set_frame(self.anim_state.play(clip, name))
         return self
 
     def play_animation(self, name: str | None = None):
@@ -394,33 +806,22 @@ class Sprite:
         Args:
             name (str | None): Switch to this animation if given.
         """
-        if not self.animations:
+        state = self.anim_state
+        if name and (state.clip is None or name != state.name):
+            clip = self._get_animation(name)
+            if clip is not None:
+                self._set_frame(state.play(clip, name))
             return
 
-        if name and name != self.current_animation:
-            self.current_animation = name
-            self.animations[name]["index"] = 0
-            self.animations[name]["timer"] = 0
-            self.img = self.animations[name]["frames"][0]
-            self.rect_update()
+        if state.clip is None:
+            first = self._first_animation()
+            if first is not None:
+                self._set_frame(state.play(first[1], first[0]))
             return
 
-        anim = self.animations[self.current_animation]
-        dt = self.engine.dt
-
-        anim["timer"] += dt
-        if anim["timer"] >= anim["speed"]:
-            anim["timer"] = 0
-            anim["index"] += 1
-
-            if anim["index"] >= len(anim["frames"]):
-                if anim["loop"]:
-                    anim["index"] = 0
-                else:
-                    anim["index"] = len(anim["frames"]) - 1
-
-            self.img = anim["frames"][anim["index"]]
-            self.rect_update()
+        frame = state.advance(self.engine.dt)
+        if frame is not None:
+            self._set_frame(frame)
 
     @staticmethod
     def create_image(path: str = "", width: int | None = None, height: int | None = None):
@@ -433,12 +834,9 @@ class Sprite:
             height (int | None): Height to scale.
 
         Returns:
-            pygame.Surface: Loaded and scaled image.
+            pygame.Surface: Loaded and scaled image (shared, from `AssetManager`).
         """
-        img = pygame.image.load(path).convert_alpha()
-        if width and height:
-            img = pygame.transform.scale(img, (width, height))
-        return img
+        return AssetManager.load_image(path, width, height)
 
 class Group:
     """
@@ -451,6 +849,7 @@ class Group:
         * scaling
         * rotation
         * collision checks
+        * vectorized movement and collision (NumPy, see `set_vectorized`)
     """
 
     def __init__(self, *sprites: Sprite):
@@ -460,7 +859,22 @@ class Group:
         Args:
             *sprites (Sprite): Sprites to add.
         """
-        self.sprites: list[Sprite] = list(sprites)
+        self.sprites: list[Sprite] = []
+        self._members = set()  # O(1) membership of self.sprites
+        self._scene = None  # scene the group is registered in
+
+        # Structure of arrays (vectorized mode)
+        self.vectorized = False
+        self._velocity = {}  # sprite -> (vx, vy) when not vectorized
+        self._soa_sprites: list[Sprite] = []  # sprites the arrays were built for
+        self._pos = None  # (n, 2) float top-left positions
+        self._size = None  # (n, 2) rect sizes
+        self._vel = None  # (n, 2) velocities, pixels per second
+        self._written = None  # (n, 2) int positions last written to rects
+        self._soa_dirty = True  # membership changed, rebuild arrays
+        self._arrays_ahead = False  # arrays hold moves not yet written to sprites
+
+        self.add(*sprites)
         Sprite._counter += 1
         self.count = Sprite._counter
 
@@ -474,9 +888,14 @@ class Group:
         Returns:
             Group: Returns self for chaining.
         """
+        if self._arrays_ahead:
+            self.sync()
         for sprite in sprites:
-            if sprite not in self.sprites:
+            if sprite not in self._members:
+                self._members.add(sprite)
                 self.sprites.append(sprite)
+                self._set_member_scene(sprite, self._scene)
+                self._soa_dirty = True
         return self
 
     def remove(self, *sprites: Sprite):
@@ -489,11 +908,43 @@ class Group:
         Returns:
             Group: Returns self for chaining.
         """
-        for sprite in sprites:
-            if sprite in self.sprites:
-                self.sprites.remove(sprite)
+        removed = {sprite for sprite in sprites if sprite in self._members}
+        if removed:
+            if self._arrays_ahead:
+                self.sync()
+            self._members -= removed
+            self.sprites = [s for s in self.sprites if s not in removed]
+            for sprite in removed:
+                self._velocity.pop(sprite, None)
+                if sprite.scene is self._scene:
+                    self._set_member_scene(sprite, None)
+            self._soa_dirty = True
         return self
 
+    @property
+    def scene(self):
+        """Scene the group is registered in (set by Scene)."""
+        return self._scene
+
+    @scene.setter
+    def scene(self, scene):
+        old, self._scene = self._scene, scene
+        for sprite in self.sprites:
+            if sprite.scene is old:
+                self._set_member_scene(sprite, scene)
+
+    @staticmethod
+    def _set_member_scene(sprite: Sprite, scene):
+        """
+        Let a member draw through the group's scene (camera, culling, batching).
+
+        Sprites registered in a scene themselves keep their own scene.
+        """
+        current = sprite.scene
+        if current is not None and sprite in current._members:
+            return
+        sprite.scene = scene
+
     def draw(self):
         """
         Draw all sprites in the group.
@@ -501,6 +952,7 @@ class Group:
         Returns:
             Group: Returns self for chaining.
         """
+        self.sync()
         for sprite in self.sprites:
             sprite.draw()
         return self
@@ -514,11 +966,57 @@ class Group:
         Returns:
             Group: Returns self for chaining.
         """
+        self.sync()
+        dead = []
         for sprite in self.sprites:
             sprite.draw()
             sprite.update()
             if not sprite.alive:
-                self.remove(sprite)
+                dead.append(sprite)
+
+        # remove dead sprites in one pass after iteration
+        if dead:
+            self.remove(*dead)
+        return self
+
+    def play_animations(self, name: str | None = None):
+        """
+        Advance animations of all sprites in one pass.
+
+        Args:
+            name (str | None): Switch every sprite to this animation if given.
+
+        Returns:
+            Group: Returns self for chaining.
+        """
+        if name is not None:
+            for sprite in self.sprites:
+                sprite.play_animation(name)
+            return self
+
+        if not self.sprites:
+            return self
+        dt = self.sprites[0].engine.dt
+        for sprite in self.sprites:
+            state = sprite.anim_state
+            if state.clip is None:
+                sprite.play_animation()  # starts the first animation, like per sprite
+                continue
+            frame = state.advance(dt)
+            if frame is not None:
+                sprite._set_frame(frame)
+        return self
+
+    def fixed_update(self):
+        """
+        Run one fixed-timestep simulation step for all sprites in the group.
+
+        Returns:
+            Group: Returns self for chaining.
+        """
+        self.sync()
+        for sprite in self.sprites:
+            sprite.fixed_update()
         return self
 
     def move(self, dx: float = 0, dy: float = 0):
@@ -532,10 +1030,111 @@ class Group:
         Returns:
             Group: Returns self for chaining.
         """
+        if self.vectorized:
+            self._arrays()
+            self._pos += (dx, dy)
+            return self
         for sprite in self.sprites:
             sprite.move(dx, dy)
         return self
 
+    def move_to(self, target, speed: float):
+        """
+        Move all sprites towards a target with given speed (see `Sprite.move_to`).
+
+        Args:
+            target (Sprite | tuple): Target point or another sprite.
+            speed (float): Movement speed in pixels per second.
+
+        Returns:
+            Group: Returns self for chaining.
+        """
+        if not self.vectorized:
+            for sprite in self.sprites:
+                sprite.move_to(target, speed)
+            return self
+
+        tx, ty = target.rect.center if isinstance(target, Sprite) else target
+        pos = self._arrays()
+        if not len(pos):
+            return self
+        delta = (tx, ty) - (pos + self._size // 2)
+        dist = np.hypot(delta[:, 0], delta[:, 1])
+        moving = dist > 0
+        step = speed * self.sprites[0].engine.dt
+        pos[moving] += delta[moving] / dist[moving, None] * step
+        return self
+
+    def set_velocity(self, vx: float = 0, vy: float = 0, sprite: Sprite | None = None):
+        """
+        Set velocity used by `apply_velocity`.
+
+        Args:
+            vx (float): X velocity in pixels per second.
+            vy (float): Y velocity in pixels per second.
+            sprite (Sprite | None): Only this sprite (default: all).
+
+        Returns:
+            Group: Returns self for chaining.
+        """
+        if self.vectorized:
+            self._arrays()
+            if sprite is None:
+                self._vel[:] = (vx, vy)
+            elif sprite in self._members:
+                self._vel[self.sprites.index(sprite)] = (vx, vy)
+            return self
+        for s in (self.sprites if sprite is None else (sprite,)):
+            if s in self._members:
+                self._velocity[s] = (vx, vy)
+        return self
+
+    def apply_velocity(self, dt: float | None = None):
+        """
+        Move every sprite by its velocity.
+
+        Args:
+            dt (float | None): Time step in seconds (default: engine.dt).
+
+        Returns:
+            Group: Returns self for chaining.
+        """
+        if not self.sprites:
+            return self
+        if dt is None:
+            dt = self.sprites[0].engine.dt
+        if self.vectorized:
+            self._arrays()
+            self._pos += self._vel * dt
+            return self
+        for sprite, (vx, vy) in self._velocity.items():
+            sprite.move(vx * dt, vy * dt)
+        return self
+
+    def stay_in_rect(self, rect: pygame.Rect):
+        """
+        Clamp all sprites inside the given rect.
+
+        Args:
+            rect (pygame.Rect): Rectangle boundary.
+
+        Returns:
+            Group: Returns self for chaining.
+        """
+        if not self.vectorized:
+            for sprite in self.sprites:
+                sprite.stay_in_rect(rect)
+            return self
+
+        rect = pygame.Rect(rect)
+        pos, size = self._arrays(), self._size
+        low = np.array(rect.topleft, float)
+        high = rect.bottomright - size
+        clamped = np.minimum(np.maximum(pos, low), high)
+        # sprites bigger than rect are centered, like Rect.clamp_ip
+        pos[:] = np.where(size > rect.size, rect.center - size // 2, clamped)
+        return self
+
     def scale(self, width: int, height: int):
         """
         Scale all sprites in the group.
@@ -547,6 +1146,7 @@ class Group:
         Returns:
             Group: Returns self for chaining.
         """
+        self.sync()
         for sprite in self.sprites:
             sprite.scale(width, height)
         return self
@@ -578,24 +1178,219 @@ class Group:
 
     def __iter__(self):
         """Iterate over sprites."""
+        self.sync()
         return iter(self.sprites)
 
     def __len__(self):
         """Return number of sprites in the group."""
         return len(self.sprites)
 
+    def __contains__(self, sprite):
+        """Check if sprite is in the group."""
+        return sprite in self._members
+
     def __getitem__(self, idx: int):
         """Return sprite at index."""
+        self.sync()
         return self.sprites[idx]
 
-    def collide(self, sprite: Sprite):
+    def collide(self, sprite):
         """
         Get list of sprites colliding with given sprite.
 
+        In vectorized mode this is one AABB test over all sprites and the
+        sprites' collide cooldowns are not used.
+
         Args:
-            sprite (Sprite): Sprite to check against.
+            sprite (Sprite | pygame.Rect | Group): Sprite, rect or group to check against.
 
         Returns:
             list[Sprite]: Colliding sprites.
         """
-        return [s for s in self.sprites if s.collide(sprite)]
+        if isinstance(sprite, Group):
+            return self._collide_group_any(sprite)
+        if not self.vectorized:
+            if isinstance(sprite, Sprite):
+                return [s for s in self.sprites if s.collide(sprite)]
+            rect = pygame.Rect(sprite)
+            return [s for s in self.sprites if s.collide(rect=rect)]
+
+        if isinstance(sprite, Sprite):
+            if not sprite.alive:
+                return []
+            rect = sprite.rect
+        else:
+            rect = pygame.Rect(sprite)
+        pos = self._arrays()
+        right, bottom = pos[:, 0] + self._size[:, 0], pos[:, 1] + self._size[:, 1]
+        hit = (pos[:, 0] < rect.right) & (right > rect.left) & (pos[:, 1] < rect.bottom) & (bottom > rect.top)
+        sprites = self.sprites
+        return [sprites[i] for i in np.flatnonzero(hit) if sprites[i] is not sprite]
+
+    def collide_group(self, other: "Group", callback=None, pixel_perfect: bool = False) -> list[tuple[Sprite, Sprite]]:
+        """
+        Find all overlapping pairs between this group and another one.
+
+        Uses sort-and-sweep along X, so only sprites whose X ranges overlap
+        are compared. Sprite collide cooldowns are not used.
+
+        Args:
+            other (Group): Group to check against (may be this group itself).
+            callback (Callable[[Sprite, Sprite], None] | None): Called for every pair.
+            pixel_perfect (bool): Check candidate pairs with masks (`Sprite.collide_mask`).
+
+        Returns:
+            list[tuple[Sprite, Sprite]]: Pairs (sprite of this group, sprite of `other`).
+        """
+        self.sync()
+        other.sync()
+        same = other is self
+
+        entries = [(s.rect.left, 0, s) for s in self.sprites if s.alive]
+        if not same:
+            entries += [(o.rect.left, 1, o) for o in other.sprites if o.alive]
+        entries.sort(key=lambda e: e[0])
+
+        pairs = []
+        active = [[], []]  # sprites whose X range is still open, per group
+        for left, side, sprite in entries:
+            rect = sprite.rect
+            target = 0 if same else 1 - side
+            active[target] = [s for s in active[target] if s.rect.right > left]
+
+            for candidate in active[target]:
+                if not rect.colliderect(candidate.rect):
+                    continue
+                if pixel_perfect and not sprite.collide_mask(candidate):
+                    continue
+                pair = (candidate, sprite) if same or side == 1 else (sprite, candidate)
+                pairs.append(pair)
+                if callback is not None:
+                    callback(*pair)
+            active[side].append(sprite)
+        return pairs
+
+    def _collide_group_any(self, other: "Group") -> list[Sprite]:
+        """Own sprites overlapping any alive sprite of `other` (AABB)."""
+        if not self.vectorized:
+            rects = [o.rect for o in other.sprites if o.alive]
+            return [s for s in self.sprites if s.rect.collidelist(rects) != -1]
+
+        pos, size = self._arrays(), self._size
+        if other.vectorized:
+            opos, osize = other._arrays(), other._size
+            alive = np.fromiter((o.alive for o in other.sprites), bool, len(other.sprites))
+            opos, osize = opos[alive], osize[alive]
+        else:
+            rects = np.array([o.rect[:] for o in other.sprites if o.alive], float).reshape(-1, 4)
+            opos, osize = rects[:, :2], rects[:, 2:]
+        if not len(pos) or not len(opos):
+            return []
+
+        # (n, m) overlap matrix
+        omax = opos + osize
+        hit = (
+            (pos[:, None, 0] < omax[None, :, 0])
+            & (pos[:, None, 0] + size[:, None, 0] > opos[None, :, 0])
+            & (pos[:, None, 1] < omax[None, :, 1])
+            & (pos[:, None, 1] + size[:, None, 1] > opos[None, :, 1])
+        )
+        sprites = self.sprites
+        return [sprites[i] for i in np.flatnonzero(hit.any(axis=1))]
+
+    # ========================
+    # VECTORIZED MODE
+    # ========================
+    def set_vectorized(self, value: bool = True):
+        """
+        Keep positions, sizes and velocities of sprites in NumPy arrays.
+
+        Bulk `move`, `move_to`, `apply_velocity`, `stay_in_rect` and `collide`
+        then run on the arrays. Positions are written back to sprite rects
+        lazily: when the group is drawn, updated or iterated, or on `sync()`.
+        Requires NumPy.
+
+        Args:
+            value (bool): Enable or disable.
+
+        Returns:
+            Group: Returns self for chaining.
+        """
+        if value and np is None:
+            from .dev_tools import log
+            log("NumPy is not installed, vectorized mode is unavailable", "Group", True)
+            return self
+        if not value and self.vectorized:
+            self.sync()
+            self._velocity = {
+                s: (float(v[0]), float(v[1]))
+                for s, v in zip(self._soa_sprites, self._vel)
+                if s in self._members and (v[0] or v[1])
+            }
+            self._soa_sprites, self._pos, self._size, self._vel, self._written = [], None, None, None, None
+        elif value and not self.vectorized:
+            self._soa_dirty = True
+        self.vectorized = value
+        return self
+
+    def _arrays(self):
+        """
+        Get up-to-date (n, 2) position array, rebuilding it after membership
+        changes and picking up sprites that moved on their own.
+        """
+        sprites = self.sprites
+        if self._soa_dirty:
+            n = len(sprites)
+            rects = np.array([s.rect[:] for s in sprites], float).reshape(n, 4)
+            pos, vel = np.array([s._position() for s in sprites], float).reshape(n, 2), np.zeros((n, 2))
+            if self._pos is not None:
+                # carry over velocities and sub-pixel positions of kept sprites
+                old = {s: i for i, s in enumerate(self._soa_sprites)}
+                new_idx = [j for j, s in enumerate(sprites) if s in old]
+                old_idx = [old[sprites[j]] for j in new_idx]
+                vel[new_idx] = self._vel[old_idx]
+                same = (self._written[old_idx] == pos[new_idx]).all(axis=1)
+                pos[np.array(new_idx, int)[same]] = self._pos[old_idx][same]
+            for j, s in enumerate(sprites):
+                if s in self._velocity:
+                    vel[j] = self._velocity[s]
+            self._pos, self._size, self._vel = pos, rects[:, 2:].copy(), vel
+            self._written = rects[:, :2].astype(int)
+            self._soa_sprites = list(sprites)
+            self._velocity = {}
+            self._soa_dirty = False
+        elif not self._arrays_ahead:
+            # sprites are up to date, keep sub-pixel positions unless a sprite moved itself
+            n = len(sprites)
+            rects = np.array([s.rect[:] for s in sprites], int).reshape(n, 4)
+            moved = (rects[:, :2] != self._written).any(axis=1)
+            if moved.any():
+                moved_idx = np.flatnonzero(moved)
+                self._pos[moved_idx] = [sprites[i]._position() for i in moved_idx.tolist()]
+                self._written[moved_idx] = rects[moved_idx, :2]
+            self._size[:] = rects[:, 2:]
+
+        self._arrays_ahead = True
+        return self._pos
+
+    def sync(self):
+        """
+        Write array positions back to sprite rects (vectorized mode).
+
+        Returns:
+            Group: Returns self for chaining.
+        """
+        if not self._arrays_ahead:
+            return self
+        self._arrays_ahead = False
+        new = np.floor(self._pos + 0.5).astype(int)
+        changed = np.flatnonzero((new != self._written).any(axis=1))
+        self._written = new
+        sprites = self._soa_sprites
+        pos = self._pos[changed].tolist()
+        for i, x, y, (fx, fy) in zip(changed.tolist(), new[changed, 0].tolist(), new[changed, 1].tolist(), pos):
+            sprite = sprites[i]
+            sprite.rect.topleft = (x, y)
+            sprite.x, sprite.y = fx, fy
+            sprite._moved()
+        return self
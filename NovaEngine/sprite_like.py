@@ -7,6 +7,8 @@ from .gui import TextLabel
 __all__ = ["ProgressBar", "Projectile", "Dummy", "Rect", "Popup"]
 
 class ProgressBar(Sprite):
+    screen_space = True
+
     def __init__(
         self,
         width,
@@ -54,6 +56,7 @@ class ProgressBar(Sprite):
     def draw(self):
         """Draws progress-bar on the screen"""
         if self.alive:
+            self.engine.mark_dirty(self.rect.copy(), ("bar", self.value, self.max_value))
             # bg
             pygame.draw.rect(self.surface, self.bg_color, self.rect)
             # filled
@@ -90,12 +93,12 @@ class Projectile(Sprite):
         height=None,
         start=None,
         target=None,
-        speed: int = 100,
+        speed: float = 3000,
     ):
         super().__init__(img_path, width, height)
         self.start = start
         self.target = target
-        self.speed = speed
+        self.speed = speed  # pixels per second (3000 = the old 50 px per frame at 60 FPS)
 
         try:
             sx, sy = start[0], start[1]
@@ -109,10 +112,11 @@ class Projectile(Sprite):
             print(f"[NovaEngine] Error: {e}")
 
     def update(self):
-        if not self.collide(rect=self.engine.screen.get_rect()):
+        # plain rect test: collide() has a cooldown and would report "off screen"
+        if not self.rect.colliderect(self.engine.screen.get_rect()):
             self.kill()
         self.draw()
-        self.move_angle(50)
+        self.move_angle(self.speed * self.engine.dt)
 
 
 class Dummy(Sprite):
@@ -127,10 +131,11 @@ class Rect(Sprite):
 
         self.color = color
         self.border = border
-        self.rect = rect
+        self.rect = pygame.Rect(rect)
     
     def update(self):
-        pygame.draw.rect(self.engine.screen, self.color, self.rect, self.border)
+        drawn = pygame.draw.rect(self.engine.screen, self.color, self.rect, self.border)
+        self.engine.mark_dirty(drawn, ("rect", self.color, self.border))
 
 
 class Popup(TextLabel):
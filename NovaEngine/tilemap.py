@@ -0,0 +1,306 @@
+"""===== tilemap.py =====
+Module for grid-based tile maps.
+
+Provides the Tilemap class: tiles are stored as ids in a compact array,
+pre-rendered into chunk surfaces and drawn chunk by chunk, and collision
+is checked on the grid, so walls need no per-tile Sprite objects.
+"""
+
+from array import array
+import pygame
+
+
+class Tilemap:
+    """
+    Grid of tiles drawn from pre-rendered chunks.
+
+    Supports:
+        * compact tile storage (one unsigned short per tile)
+        * lazy chunk rendering, only visible chunks are drawn
+        * grid collision queries against solid tile ids
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        tile_size: int = 32,
+        tileset: dict | None = None,
+        solid_tiles=(),
+        chunk_size: int = 16,
+        data=None,
+    ):
+        """
+        Initialize a new tilemap.
+
+        Args:
+            width (int): Width in tiles.
+            height (int): Height in tiles.
+            tile_size (int): Tile size in pixels.
+            tileset (dict | None): Tile id -> pygame.Surface or RGB color. Id 0 is empty.
+            solid_tiles (Iterable[int]): Tile ids that block movement.
+            chunk_size (int): Chunk size in tiles.
+            data (Iterable[int] | None): Row-major tile ids.
+        """
+        from .core import NovaEngine
+        from .sprite import Sprite
+
+        self.engine = NovaEngine.Engine
+        self.surface = self.engine.screen
+        self.alive = True
+        self.solid = False
+        self.scene = None
+        self.layer = 0
+
+        Sprite._counter += 1
+        self.count = Sprite._counter
+
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        self.chunk_size = chunk_size
+        self.x, self.y = 0, 0  # world position of the top-left tile
+
+        self.tiles = array("H", [0]) * (width * height)
+        if data is not None:
+            for i, tile in enumerate(data):
+                self.tiles[i] = tile
+
+        self._chunks: dict[tuple[int, int], pygame.Surface] = {}  # rendered chunks
+        self._dirty_chunks: set[tuple[int, int]] = set()
+
+        self.solid_tiles = set(solid_tiles)
+        self.tileset: dict[int, pygame.Surface] = {}
+        for tile, image in (tileset or {}).items():
+            self.set_tile_image(tile, image)
+
+    @classmethod
+    def from_grid(cls, grid: list[list[int]], tile_size: int = 32, tileset: dict | None = None, solid_tiles=(), chunk_size: int = 16):
+        """
+        Create tilemap from a list of rows.
+
+        Args:
+            grid (list[list[int]]): Rows of tile ids.
+
+        Returns:
+            Tilemap: New tilemap.
+        """
+        height = len(grid)
+        width = len(grid[0]) if height else 0
+        data = [tile for row in grid for tile in row]
+        return cls(width, height, tile_size, tileset, solid_tiles, chunk_size, data)
+
+    # ========================
+    # TILES
+    # ========================
+    def set_tile_image(self, tile: int, image):
+        """
+        Set image of a tile id.
+
+        Args:
+            tile (int): Tile id.
+            image (pygame.Surface | tuple): Image or RGB color.
+
+        Returns:
+            Tilemap: Returns self for chaining.
+        """
+        size = (self.tile_size, self.tile_size)
+        if isinstance(image, pygame.Surface):
+            if image.get_size() != size:
+                image = pygame.transform.scale(image, size)
+        else:
+            color = image
+            image = pygame.Surface(size)
+            image.fill(color)
+        self.tileset[tile] = image
+        self._chunks.clear()
+        return self
+
+    def in_bounds(self, tx: int, ty: int) -> bool:
+        """Check if tile coordinates are inside the map."""
+        return 0 <= tx < self.width and 0 <= ty < self.height
+
+    def get_tile(self, tx: int, ty: int) -> int:
+        """Get tile id at tile coordinates (0 outside the map)."""
+        if 0 <= tx < self.width and 0 <= ty < self.height:
+            return self.tiles[ty * self.width + tx]
+        return 0
+
+    def set_tile(self, tx: int, ty: int, tile: int):
+        """
+        Set tile id at tile coordinates. Its chunk is re-rendered on next draw.
+
+        Returns:
+            Tilemap: Returns self for chaining.
+        """
+        if self.in_bounds(tx, ty):
+            self.tiles[ty * self.width + tx] = tile
+            self._dirty_chunks.add((tx // self.chunk_size, ty // self.chunk_size))
+        return self
+
+    def world_to_tile(self, x: float, y: float) -> tuple[int, int]:
+        """Convert world pixel position to tile coordinates."""
+        return int((x - self.x) // self.tile_size), int((y - self.y) // self.tile_size)
+
+    def tile_rect(self, tx: int, ty: int) -> pygame.Rect:
+        """Get world rect of a tile."""
+        ts = self.tile_size
+        return pygame.Rect(self.x + tx * ts, self.y + ty * ts, ts, ts)
+
+    def set_position(self, x: float | None = None, y: float | None = None):
+        """
+        Set world position of the top-left tile.
+
+        Returns:
+            Tilemap: Returns self for chaining.
+        """
+        if x is not None:
+            self.x = x
+        if y is not None:
+            self.y = y
+        return self
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """World rect of the whole map."""
+        return pygame.Rect(self.x, self.y, self.width * self.tile_size, self.height * self.tile_size)
+
+    # ========================
+    # COLLISION
+    # ========================
+    def _tile_range(self, rect):
+        rect = pygame.Rect(rect)
+        tx0, ty0 = self.world_to_tile(rect.left, rect.top)
+        tx1, ty1 = self.world_to_tile(rect.right - 1, rect.bottom - 1)
+        return max(tx0, 0), max(ty0, 0), min(tx1, self.width - 1), min(ty1, self.height - 1)
+
+    def is_solid(self, tx: int, ty: int) -> bool:
+        """Check if tile at tile coordinates is solid."""
+        return self.get_tile(tx, ty) in self.solid_tiles
+
+    def collide_rect(self, rect) -> bool:
+        """
+        Check if rect overlaps any solid tile.
+
+        Args:
+            rect (pygame.Rect | tuple): World rect.
+
+        Returns:
+            bool: True if a solid tile is hit.
+        """
+        solid = self.solid_tiles
+        if not solid:
+            return False
+        tiles, w = self.tiles, self.width
+        tx0, ty0, tx1, ty1 = self._tile_range(rect)
+        for ty in range(ty0, ty1 + 1):
+            row = ty * w
+            for tx in range(tx0, tx1 + 1):
+                if tiles[row + tx] in solid:
+                    return True
+        return False
+
+    def solid_rects(self, rect) -> list[pygame.Rect]:
+        """
+        Get world rects of solid tiles overlapping `rect`.
+
+        Args:
+            rect (pygame.Rect | tuple): World rect.
+
+        Returns:
+            list[pygame.Rect]: Tile rects.
+        """
+        solid = self.solid_tiles
+        tiles, w = self.tiles, self.width
+        tx0, ty0, tx1, ty1 = self._tile_range(rect)
+        return [
+            self.tile_rect(tx, ty)
+            for ty in range(ty0, ty1 + 1)
+            for tx in range(tx0, tx1 + 1)
+            if tiles[ty * w + tx] in solid
+        ]
+
+    # ========================
+    # RENDERING
+    # ========================
+    def _render_chunk(self, cx: int, cy: int) -> pygame.Surface:
+        """Pre-render one chunk of tiles into a surface."""
+        cs, ts = self.chunk_size, self.tile_size
+        tx0, ty0 = cx * cs, cy * cs
+        tx1, ty1 = min(tx0 + cs, self.width), min(ty0 + cs, self.height)
+
+        chunk = pygame.Surface(((tx1 - tx0) * ts, (ty1 - ty0) * ts), pygame.SRCALPHA)
+        tileset, tiles, w = self.tileset, self.tiles, self.width
+        seq = []
+        for ty in range(ty0, ty1):
+            row = ty * w
+            for tx in range(tx0, tx1):
+                image = tileset.get(tiles[row + tx])
+                if image is not None:
+                    seq.append((image, ((tx - tx0) * ts, (ty - ty0) * ts)))
+        chunk.blits(seq, False)
+
+        self._chunks[(cx, cy)] = chunk
+        return chunk
+
+    def visible_chunks(self, view: pygame.Rect):
+        """
+        Yield (chunk surface, world position) of chunks overlapping `view`.
+
+        Args:
+            view (pygame.Rect): Visible world area.
+        """
+        for key in self._dirty_chunks:
+            self._chunks.pop(key, None)
+        self._dirty_chunks.clear()
+
+        span = self.chunk_size * self.tile_size
+        cx0 = max(int((view.left - self.x) // span), 0)
+        cy0 = max(int((view.top - self.y) // span), 0)
+        cx1 = min(int((view.right - 1 - self.x) // span), (self.width - 1) // self.chunk_size)
+        cy1 = min(int((view.bottom - 1 - self.y) // span), (self.height - 1) // self.chunk_size)
+
+        chunks = self._chunks
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                chunk = chunks.get((cx, cy)) or self._render_chunk(cx, cy)
+                yield chunk, (self.x + cx * span, self.y + cy * span)
+
+    def draw(self):
+        """
+        Draw visible chunks to the screen surface.
+
+        Returns:
+            Tilemap: Returns self for chaining.
+        """
+        if not self.alive:
+            return self
+
+        scene = self.scene
+        batch = scene is not None and scene.batching and scene._updating
+        camera = scene.camera if scene is not None else None
+        view = camera.viewport if camera is not None else self.surface.get_rect()
+
+        for chunk, pos in self.visible_chunks(view):
+            if camera is not None:
+                chunk, pos = camera.apply(chunk, pos)
+            if batch:
+                scene._batch.append((chunk, pos))
+            else:
+                drawn = self.surface.blit(chunk, pos)
+                self.engine.mark_dirty(drawn, chunk)
+        return self
+
+    def update(self):
+        """Draw the map."""
+        self.draw()
+
+    def kill(self):
+        """
+        Mark tilemap as dead (not drawn, removed from scene).
+
+        Returns:
+            Tilemap: Returns self for chaining.
+        """
+        self.alive = False
+        return self
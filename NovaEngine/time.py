@@ -1,6 +1,5 @@
 """===== time.py ====="""
 
-import threading
 from .core import NovaEngine
 
 class Time:
@@ -8,46 +7,72 @@ class Time:
     def time_freeze():
         NovaEngine.Engine.time_froze = True
         NovaEngine.Engine.previous_time = NovaEngine.Engine.in_game_time
+        NovaEngine.Engine.pause_cooldowns()
     
     @staticmethod
     def time_unfreeze():
         NovaEngine.Engine.time_froze = False
         NovaEngine.Engine.time_spent_frozed = (NovaEngine.Engine.time - NovaEngine.Engine.previous_time)
+        NovaEngine.Engine.resume_cooldowns()
+
+    @staticmethod
+    def after(duration, func):
+        """
+        Call `func` once after `duration` seconds of in-game time.
+
+        Returns:
+            TimerHandle: Handle with `cancel()`.
+        """
+        engine = NovaEngine.Engine
+        return engine.scheduler.call_at(engine.in_game_time + duration * 1000, func)
+
+    @staticmethod
+    def every(cooldown, func, count=-1, delay=0):
+        """
+        Call `func` every `cooldown` seconds of in-game time, `count` times (-1 for infinite).
+
+        Returns:
+            TimerHandle: Handle with `cancel()`.
+        """
+        engine = NovaEngine.Engine
+        return engine.scheduler.call_at(
+            engine.in_game_time + delay * 1000, func, interval=cooldown * 1000, count=count
+        )
 
     @staticmethod
     def Timer(duration):
-        """Decorator to run function after $duration$ seconds."""
+        """
+        Decorator to run function after $duration$ seconds.
+
+        Runs on the main thread between frames and waits while time is frozen.
+        Handle for cancellation is stored as `func.timer`.
+        """
 
         def decorator(func):
-            threading.Timer(duration, func).start()
+            func.timer = Time.after(duration, func)
             return func
 
         return decorator
     
     @staticmethod
     def Interval(count, cooldown):
-        """Call function `count` times with delay `cooldown` seconds (use -1 for infinite)."""
-        def decorator(func):
-            import threading
-            def cycle():
-                import time
-                if count == -1:
-                    while True:
-                        func()
-                        time.sleep(cooldown)
-                else:
-                    for _ in range(count):
-                        func()
-                        time.sleep(cooldown)
-            
-            threading.Thread(target=cycle, daemon=True).run()
+        """
+        Call function `count` times with delay `cooldown` seconds (use -1 for infinite).
 
+        First call happens on the next frame. Runs on the main thread and
+        waits while time is frozen. Handle for cancellation is stored as `func.timer`.
+        """
+        def decorator(func):
+            func.timer = Time.every(cooldown, func, count)
             return func
 
         return decorator
     
     class Cooldown:
         """Check or create a cooldown for a key."""
+
+        __slots__ = ("engine", "duration", "state", "start_time", "now", "paused_at", "__weakref__")
+
         def __init__(self, duration):
             """Initializes Cooldown. Duration must be in seconds."""
             self.engine = NovaEngine.Engine
@@ -55,17 +80,35 @@ class Time:
             self.duration = duration*1000
             self.state = True
             self.start_time = 0
+            self.now = 0
+            self.paused_at = None
 
-            self.engine.cooldowns.append(self)
+            # weak registration: forgotten cooldowns are freed with their owners
+            self.engine.cooldowns.add(self)
+            if self.engine.cooldowns_paused:
+                self.pause()
 
         def check(self):
             # Checks if coolodown is ready
-            self.now = self.engine.time
+            self.now = self.engine.time if self.paused_at is None else self.paused_at
             self.state = self.now - self.start_time >= self.duration
             return self.state
         
         def start(self):
             # Called one time and starts cooldown
-            self.start_time = self.engine.time
+            self.start_time = self.engine.time if self.paused_at is None else self.paused_at
             self.state = False
-            return self
\ No newline at end of file
+            return self
+
+        def pause(self):
+            # Stops the countdown until resume()
+            if self.paused_at is None:
+                self.paused_at = self.engine.time
+            return self
+
+        def resume(self):
+            # Continues the countdown, time spent paused is not counted
+            if self.paused_at is not None:
+                self.start_time += self.engine.time - self.paused_at
+                self.paused_at = None
+            return self
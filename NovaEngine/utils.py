@@ -20,6 +20,11 @@ class Utils:
         image: pygame.Surface = None,
     ):
         """Fill the screen with a color or an image."""
+        if NovaEngine.Engine.dirty_rendering:
+            # background is restored only under changed areas
+            NovaEngine.Engine.set_background(image if image else color)
+            return
+
         if image:
             NovaEngine.Engine.screen.blit(image, (0, 0))
         else:
@@ -27,6 +32,16 @@ class Utils:
                 color = color.value
             NovaEngine.Engine.screen.fill(color)
 
+    @staticmethod
+    def get_font(font: str = "TimesNewRoman", size: int = 14) -> pygame.font.Font:
+        """Get pooled font object (SysFont lookup is slow, so it's done once per font and size)."""
+        key = (font, size)
+        font_obj = NovaEngine.Engine._fonts.get(key)
+        if font_obj is None:
+            font_obj = pygame.font.SysFont(font, size)
+            NovaEngine.Engine._fonts[key] = font_obj
+        return font_obj
+
     @staticmethod
     def render_text(
         text: str,
@@ -36,17 +51,32 @@ class Utils:
         size: int = 14,
         color: Union[Colors, Tuple[int, int, int]] = Colors.BLACK,
         center: bool = False,
+        glyphs: bool = False,
     ):
-        """Render text on screen with caching."""
+        """
+        Render text on screen with caching.
+
+        Rendered strings are kept in a bounded LRU (`Engine.text_cache_size`).
+        With `glyphs=True` text is composed from cached per-character surfaces,
+        which suits often changing text (scores, FPS, coordinates).
+        """
         if isinstance(color, Colors):
             color = color.value
 
+        if glyphs:
+            return Utils._render_glyphs(text, x, y, font, size, color, center)
+
+        engine = NovaEngine.Engine
+        cache = engine._text_cache
         cache_key = (text, font, size, color)
-        text_surf = NovaEngine.Engine._text_cache.get(cache_key)
+        text_surf = cache.get(cache_key)
         if text_surf is None:
-            font_obj = pygame.font.SysFont(font, size)
-            text_surf = font_obj.render(text, True, color)
-            NovaEngine.Engine._text_cache[cache_key] = text_surf
+            text_surf = Utils.get_font(font, size).render(text, True, color)
+            cache[cache_key] = text_surf
+            while len(cache) > engine.text_cache_size:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(cache_key)
 
         rect = text_surf.get_rect()
         if center:
@@ -54,5 +84,39 @@ class Utils:
         else:
             rect.topleft = (x, y)
 
-        NovaEngine.Engine.screen.blit(text_surf, rect)
+        drawn = engine.screen.blit(text_surf, rect)
+        engine.mark_dirty(drawn, text_surf)
+        return rect
+
+    @staticmethod
+    def _render_glyphs(text, x, y, font, size, color, center):
+        """Draw text from cached per-character surfaces."""
+        engine = NovaEngine.Engine
+        glyph_cache = engine._glyph_cache
+
+        surfs = []
+        width = 0
+        for ch in text:
+            key = (ch, font, size, color)
+            glyph = glyph_cache.get(key)
+            if glyph is None:
+                glyph = Utils.get_font(font, size).render(ch, True, color)
+                glyph_cache[key] = glyph
+            surfs.append(glyph)
+            width += glyph.get_width()
+
+        rect = pygame.Rect(0, 0, width, Utils.get_font(font, size).get_height())
+        if center:
+            rect.center = (x, y)
+        else:
+            rect.topleft = (x, y)
+
+        gx, gy = rect.topleft
+        seq = []
+        for glyph in surfs:
+            seq.append((glyph, (gx, gy)))
+            gx += glyph.get_width()
+        engine.screen.blits(seq, False)
+
+        engine.mark_dirty(rect.clip(engine.screen.get_rect()), (text, font, size, color))
         return rect
@@ -35,7 +35,7 @@ def generate_maze(width, height):
     return maze
 
 class Crawler(nova.Sprite):
-    def __init__(self, img_path, width = None, height = None, speed = 5):
+    def __init__(self, img_path, width = None, height = None, speed = 300):
         super().__init__(img_path, width, height)
         self.speed = speed
     
@@ -48,19 +48,28 @@ class Crawler(nova.Sprite):
             if app.KeyHold(pygame.K_d): dx += self.speed
             if app.KeyHold(pygame.K_w): dy -= self.speed
             if app.KeyHold(pygame.K_s): dy += self.speed
+            dx, dy = dx * app.dt, dy * app.dt  # speed is in pixels per second
 
-            self.in_bounds()
-
-            self.move(dx, dy)
+            self.move(dx, 0)
+            if not self.in_bounds(): self.move(-dx, 0)
+            self.move(0, dy)
+            if not self.in_bounds(): self.move(0, -dy)
 
     def in_bounds(self):
-        pass
+        return not maze_map.collide_rect(self.rect)
 
 Main = nova.Scene()
 with Main.sprites():
     tile_size = 32
 
-    player = Crawler("assets/hero.png", 32, 32).set_position(32, 32)
+    maze_map = nova.Tilemap.from_grid(
+        generate_maze(SCREEN_W // tile_size, SCREEN_H // tile_size),
+        tile_size,
+        tileset={1: (90, 90, 110)},
+        solid_tiles={1},
+    )
+
+    player = Crawler("assets/hero.png", 28, 28).set_position(34, 34)
 
 @Main.function()
 def _():
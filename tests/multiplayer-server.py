@@ -1,49 +1,25 @@
-import socket
-import select
-import json
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))  # бачить novaengine/
+
+from novaengine.net import NetServer
 
 HOST = "0.0.0.0"
 PORT = 5000
 
-player1_text = ""
-player2_text = ""
-
-server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-server.bind((HOST, PORT))
-server.listen()
-server.setblocking(False)
-
-clients = []
+server = NetServer(HOST, PORT, tick_rate=20)
+server.set_entity("player1", text="")
+server.set_entity("player2", text="")
 
-print(f"Server running on {HOST}:{PORT}")
+@server.on_connect()
+def connected(client):
+    print("Client connected:", client.address)
 
-while True:
-    rlist, _, _ = select.select([server] + clients, [], [], 0.05)
-    for s in rlist:
-        if s is server:
-            conn, addr = server.accept()
-            conn.setblocking(False)
-            clients.append(conn)
-            print("Client connected:", addr)
-        else:
-            try:
-                data = s.recv(4096).decode("utf-8")
-                if not data:
-                    clients.remove(s)
-                    continue
-                for line in data.splitlines():
-                    msg = json.loads(line)
-                    if msg["player"] == 1:
-                        player1_text = msg["text"]
-                    elif msg["player"] == 2:
-                        player2_text = msg["text"]
-            except:
-                clients.remove(s)
+@server.on_input()
+def handle_input(client, seq, data):
+    if data.get("player") == 1:
+        server.set_entity("player1", text=data["text"])
+    elif data.get("player") == 2:
+        server.set_entity("player2", text=data["text"])
 
-    # Розсилка стану
-    state = json.dumps({"player1": player1_text, "player2": player2_text}) + "\n"
-    for c in clients:
-        try:
-            c.sendall(state.encode("utf-8"))
-        except:
-            clients.remove(c)
+# Стан розсилається сервером автоматично: лише зміни, 20 разів на секунду
+server.run()
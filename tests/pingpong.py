@@ -13,7 +13,7 @@ class Panel(nova.Sprite):
     def __init__(self, img_path, width = None, height = None, movement="w"):
         super().__init__(img_path, width, height, solid=True)
         self.movement = movement
-        self.speed = 10
+        self.speed = 600  # pixels per second
         self.ball = None
         
         if self.movement=="w":
@@ -40,7 +40,7 @@ class Panel(nova.Sprite):
                 if self.engine.KeyHold(pygame.K_UP): dy -= self.speed
                 if self.engine.KeyHold(pygame.K_DOWN): dy += self.speed
 
-            self.move(0, dy)
+            self.move(0, dy * self.engine.dt)
             self.stay_in_rect(self.surface.get_rect())
 
             # if not self.ball:
@@ -49,10 +49,10 @@ class Panel(nova.Sprite):
             #             self.ball = obj
 
 class Ball(nova.Sprite):
-    def __init__(self, img_path=None, width = None, height = None, vel_x=5, vel_y=5):
+    def __init__(self, img_path=None, width = None, height = None, vel_x=300, vel_y=300):
         super().__init__(img_path, width, height, False)
 
-        self.vel_x, self.vel_y = vel_x, vel_y
+        self.vel_x, self.vel_y = vel_x, vel_y  # pixels per second
         self.radius = 15
         self.height = 2*self.radius
         self.width = 2*self.radius
@@ -64,23 +64,27 @@ class Ball(nova.Sprite):
     def update(self):
         if self.alive:
             self.draw()
-            self.move(self.vel_x, self.vel_y)
+            # swept move: fast ball can't pass through the thin walls
+            dt = self.engine.dt
+            hit = self.move_swept(self.vel_x * dt, self.vel_y * dt)
             self.stay_in_rect(self.surface.get_rect())
 
-            if self.collide_any(solids=True):
+            if hit:
+                if isinstance(hit[2], Wall):
+                    hit[2].add_point()
                 self._change_direction()
 
             if self.y - self.radius <= 0 or self.y + self.radius >= SCREEN_H:
                 self.vel_y = -self.vel_y  # змінюємо напрямок по Y
 
     def _change_direction(self):
-        rand_delta = random.choice([-1, 1])
+        rand_delta = random.choice([-60, 60])
         self.vel_x = -self.vel_x + rand_delta
         self.vel_y = -self.vel_y + rand_delta
         
         # cap
-        cap_x = [3, 7]
-        cap_y = [3, 7] 
+        cap_x = [180, 420]
+        cap_y = [180, 420]
         if self.vel_x != 0:
             x_sym = abs(self.vel_x)/self.vel_x
             if abs(self.vel_x) < cap_x[0]: self.vel_x = x_sym*cap_x[0]
@@ -101,15 +105,16 @@ class Wall(nova.Sprite):
 
     def update(self):
         self.rect = pygame.draw.line(self.surface, self.color, (self.x, 0), (self.x, self.height), self.width)
-        if self.collide_any():
-            if self.cd.check():
-                self.cd.start()
-                self.score += 1
+
+    def add_point(self):
+        if self.cd.check():
+            self.cd.start()
+            self.score += 1
 
 s = nova.Scene()
 with s.sprites():
 
-    ball = Ball(vel_x=random.choice([-1, 1])*random.randint(3, 5), vel_y=random.choice([-1, 1])*random.randint(3, 5)).place_centered(SCREEN_W/2, SCREEN_H/2)
+    ball = Ball(vel_x=random.choice([-1, 1])*random.randint(180, 300), vel_y=random.choice([-1, 1])*random.randint(180, 300)).place_centered(SCREEN_W/2, SCREEN_H/2)
     
     l_pan = Panel(None, 50, 200, "w")
     r_pan = Panel(None, 50, 200, "^") 